@@ -0,0 +1,285 @@
+from typing import List, Sequence, Tuple
+
+
+def colisionar(ex: Sequence[float], ey: Sequence[float], er: Sequence[float],
+               px: Sequence[float], py: Sequence[float], pr: Sequence[float],
+               out_pi: List[int], out_ei: List[int]) -> int:
+    """
+    Calcula todos los pares proyectil-enemigo cuyos círculos se tocan.
+
+    Recibe las entidades como arreglos paralelos (una lista por coordenada)
+    y escribe los índices de cada par en las listas de salida, que el
+    llamador reutiliza entre frames.
+
+    Parameters
+    ----------
+    ex, ey, er : Sequence[float]
+        Posición x, posición y y radio de cada enemigo
+    px, py, pr : Sequence[float]
+        Posición x, posición y y radio de cada proyectil
+    out_pi : List[int]
+        Lista donde se escriben los índices de proyectil de cada par (se vacía)
+    out_ei : List[int]
+        Lista donde se escriben los índices de enemigo de cada par (se vacía)
+
+    Returns
+    -------
+    int
+        Cantidad de pares encontrados
+
+    Notes
+    -----
+    Los pares quedan ordenados por proyectil y, dentro de cada proyectil, por
+    índice de enemigo. La función no depende de ningún objeto del juego, solo
+    de números, para que el bucle sea lo más simple posible.
+
+    Examples
+    --------
+    >>> pi, ei = [], []
+    >>> colisionar([0.0, 100.0], [0.0, 0.0], [10, 10], [5.0], [0.0], [8], pi, ei)
+    1
+    >>> pi, ei
+    ([0], [0])
+    """
+    out_pi.clear()
+    out_ei.clear()
+    enemigos = tuple(zip(ex, ey, er))
+    for i, (x, y, r) in enumerate(zip(px, py, pr)):
+        for j, (xj, yj, rj) in enumerate(enemigos):
+            rr = r + rj
+            dx = x - xj
+            if dx > rr or dx < -rr:
+                continue
+            dy = y - yj
+            if dy > rr or dy < -rr:
+                continue
+            if dx * dx + dy * dy <= rr * rr:
+                out_pi.append(i)
+                out_ei.append(j)
+    return len(out_pi)
+
+
+def primer_contacto(ex: Sequence[float], ey: Sequence[float], er: Sequence[float],
+                    x: float, y: float, r: float, desde: int = 0) -> int:
+    """
+    Busca el primer enemigo cuyo círculo toca a un círculo dado.
+
+    Parameters
+    ----------
+    ex, ey, er : Sequence[float]
+        Posición x, posición y y radio de cada enemigo
+    x, y, r : float
+        Centro y radio del círculo a probar (por ejemplo, el jugador)
+    desde : int, optional
+        Primer índice de enemigo a considerar (por defecto 0)
+
+    Returns
+    -------
+    int
+        Índice del primer enemigo en contacto a partir de `desde`, o -1 si no hay
+
+    Examples
+    --------
+    >>> primer_contacto([0.0, 100.0], [0.0, 0.0], [10, 10], 95.0, 0.0, 8)
+    1
+    >>> primer_contacto([0.0, 100.0], [0.0, 0.0], [10, 10], 50.0, 0.0, 8)
+    -1
+    """
+    for j in range(desde, len(ex)):
+        rr = r + er[j]
+        dx = x - ex[j]
+        if dx > rr or dx < -rr:
+            continue
+        dy = y - ey[j]
+        if dy > rr or dy < -rr:
+            continue
+        if dx * dx + dy * dy <= rr * rr:
+            return j
+    return -1
+
+
+class RejillaEspacial:
+    """
+    Rejilla uniforme para encontrar rápido los círculos cercanos a un punto.
+
+    Divide la pantalla en celdas cuadradas y guarda en cada una los índices
+    de los círculos cuyo rectángulo envolvente la toca. Trabaja con arreglos
+    paralelos de números, igual que `colisionar`.
+
+    Attributes
+    ----------
+    tam_celda : int
+        Lado de cada celda en píxeles
+    celdas_x : int
+        Número de columnas de la rejilla
+    celdas_y : int
+        Número de filas de la rejilla
+
+    Notes
+    -----
+    La rejilla se guarda en formato plano (tipo CSR): la celda c contiene los
+    índices ``_indices[_inicio[c]:_inicio[c + 1]]``. Como el área de juego es
+    la pantalla, cada celda se indexa directamente por (columna, fila) sin
+    función hash. Todas las listas se reutilizan entre construcciones, así
+    que no se crean tuplas ni listas por celda.
+
+    Examples
+    --------
+    >>> rejilla = RejillaEspacial(800, 600, 64)
+    >>> rejilla.construir([100.0, 500.0], [100.0, 300.0], [20, 20])
+    >>> salida = []
+    >>> rejilla.contactos(110.0, 100.0, 5, salida)
+    1
+    >>> salida
+    [0]
+    """
+
+    def __init__(self, ancho: int, alto: int, tam_celda: int = 64):
+        """
+        Crea una rejilla vacía que cubre un área de ancho x alto píxeles.
+
+        Parameters
+        ----------
+        ancho : int
+            Ancho del área cubierta en píxeles
+        alto : int
+            Alto del área cubierta en píxeles
+        tam_celda : int, optional
+            Lado de cada celda en píxeles (por defecto 64)
+
+        Raises
+        ------
+        ValueError
+            Si alguna dimensión no es positiva
+        """
+        if ancho <= 0 or alto <= 0 or tam_celda <= 0:
+            raise ValueError("Las dimensiones de la rejilla deben ser positivas")
+
+        self.tam_celda = tam_celda
+        self.celdas_x = -(-ancho // tam_celda)
+        self.celdas_y = -(-alto // tam_celda)
+        n_celdas = self.celdas_x * self.celdas_y
+        self._inicio: List[int] = [0] * (n_celdas + 1)
+        self._cursor: List[int] = [0] * n_celdas
+        self._indices: List[int] = []
+        self._marcas: List[int] = []  # Última consulta que visitó cada círculo
+        self._consulta = 0
+        self._xs: Sequence[float] = ()
+        self._ys: Sequence[float] = ()
+        self._rs: Sequence[float] = ()
+
+    def _rango_celdas(self, x: float, y: float, r: float) -> Tuple[int, int, int, int]:
+        """
+        Calcula las celdas que toca el rectángulo que envuelve un círculo.
+
+        Returns
+        -------
+        Tuple[int, int, int, int]
+            (cx0, cx1, cy0, cy1), rangos inclusivos recortados a la rejilla
+        """
+        celda = self.tam_celda
+        return (max(0, int((x - r) // celda)),
+                min(self.celdas_x - 1, int((x + r) // celda)),
+                max(0, int((y - r) // celda)),
+                min(self.celdas_y - 1, int((y + r) // celda)))
+
+    def construir(self, xs: Sequence[float], ys: Sequence[float],
+                  rs: Sequence[float]) -> None:
+        """
+        Reconstruye la rejilla con un nuevo conjunto de círculos.
+
+        Parameters
+        ----------
+        xs, ys, rs : Sequence[float]
+            Posición x, posición y y radio de cada círculo. La rejilla guarda
+            una referencia a estos arreglos para las consultas posteriores.
+
+        Notes
+        -----
+        Se hacen dos pasadas: contar cuántos círculos caen en cada celda
+        (convertido en posiciones de inicio con una suma acumulada) y
+        repartir los índices en su celda.
+        """
+        inicio = self._inicio
+        cursor = self._cursor
+        indices = self._indices
+        n_celdas = len(cursor)
+        ancho = self.celdas_x
+        rango_celdas = self._rango_celdas
+        n = len(xs)
+        self._xs, self._ys, self._rs = xs, ys, rs
+
+        # 1. Contar cuántos círculos caen en cada celda (desplazado una posición)
+        for c in range(n_celdas + 1):
+            inicio[c] = 0
+        for j in range(n):
+            cx0, cx1, cy0, cy1 = rango_celdas(xs[j], ys[j], rs[j])
+            for cy in range(cy0, cy1 + 1):
+                fila = cy * ancho + 1
+                for cx in range(cx0, cx1 + 1):
+                    inicio[fila + cx] += 1
+
+        # 2. Suma acumulada: inicio[c] pasa a ser la posición de la celda c
+        for c in range(n_celdas):
+            inicio[c + 1] += inicio[c]
+            cursor[c] = inicio[c]
+
+        # 3. Repartir los índices en su celda
+        total = inicio[n_celdas]
+        if len(indices) < total:
+            indices.extend([0] * (total - len(indices)))
+        for j in range(n):
+            cx0, cx1, cy0, cy1 = rango_celdas(xs[j], ys[j], rs[j])
+            for cy in range(cy0, cy1 + 1):
+                fila = cy * ancho
+                for cx in range(cx0, cx1 + 1):
+                    c = fila + cx
+                    indices[cursor[c]] = j
+                    cursor[c] += 1
+
+        marcas = self._marcas
+        if len(marcas) < n:
+            marcas.extend([0] * (n - len(marcas)))
+
+    def contactos(self, x: float, y: float, r: float, salida: List[int]) -> int:
+        """
+        Busca los círculos de la rejilla que tocan a un círculo dado.
+
+        Parameters
+        ----------
+        x, y, r : float
+            Centro y radio del círculo a probar
+        salida : List[int]
+            Lista donde se escriben los índices encontrados (se vacía); cada
+            índice aparece una sola vez aunque ocupe varias celdas
+
+        Returns
+        -------
+        int
+            Cantidad de círculos en contacto
+        """
+        salida.clear()
+        self._consulta += 1
+        consulta = self._consulta
+        marcas = self._marcas
+        inicio = self._inicio
+        indices = self._indices
+        xs, ys, rs = self._xs, self._ys, self._rs
+        ancho = self.celdas_x
+
+        cx0, cx1, cy0, cy1 = self._rango_celdas(x, y, r)
+        for cy in range(cy0, cy1 + 1):
+            fila = cy * ancho
+            for cx in range(cx0, cx1 + 1):
+                c = fila + cx
+                for k in range(inicio[c], inicio[c + 1]):
+                    j = indices[k]
+                    if marcas[j] == consulta:
+                        continue
+                    marcas[j] = consulta
+                    rr = r + rs[j]
+                    dx = x - xs[j]
+                    dy = y - ys[j]
+                    if dx * dx + dy * dy <= rr * rr:
+                        salida.append(j)
+        return len(salida)
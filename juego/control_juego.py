@@ -1,12 +1,31 @@
+import gc
+import os
 import random
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import pygame
-from typing import Optional
+from typing import Optional, Deque, Dict, List, Tuple
 
 from .figura import Figura
 from .jugador import Jugador
 from .enemigo import Enemigo
 from .proyectil import Proyectil
 from .moneda import Moneda
+from ._broadphase import RejillaEspacial, colisionar, primer_contacto
+
+def _gil_activo() -> bool:
+    """
+    Indica si el intérprete actual ejecuta Python con el GIL activado.
+
+    Returns
+    -------
+    bool
+        True salvo en compilaciones sin GIL (Python 3.13+ free-threaded)
+    """
+    esta_activo = getattr(sys, "_is_gil_enabled", None)
+    return esta_activo() if esta_activo is not None else True
+
 
 class ControlJuego:
     """
@@ -43,6 +62,15 @@ class ControlJuego:
     >>> game_manager = ControlJuego(pantalla)
     >>> game_manager.ejecutar()  # Inicia el bucle principal del juego
     """
+    # Formato del HUD para cada mejora. 'rapidez_disparo' muestra el cooldown
+    # resultante del jugador en lugar del multiplicador.
+    _FORMATO_MEJORAS: Dict[str, str] = {
+        'velocidad_misil': "Velocidad Misiles: {:.1f}x",
+        'daño_misil': "Daño Extra: +{}",
+        'rapidez_disparo': "Cooldown: {:.2f}s",
+        'puntos_extra': "Puntos Extra: +{}",
+    }
+
     def __init__(self, pantalla: pygame.Surface):
         """
         Inicializa el gestor del juego con la superficie de renderizado.
@@ -61,6 +89,9 @@ class ControlJuego:
             raise TypeError("pantalla debe ser una instancia de pygame.Surface")
 
         self.pantalla = pantalla
+        # El tamaño de la pantalla no cambia: se consulta una sola vez
+        self._ancho, self._alto = pantalla.get_size()
+        self._centro_x, self._centro_y = self._ancho // 2, self._alto // 2
         self.puntos = 10
         self.jugador: Optional[Jugador] = None
         self.enemigo: Optional[Enemigo] = None
@@ -73,19 +104,103 @@ class ControlJuego:
         # Sistema de fuentes para la interfaz de usuario
         self.fuente = pygame.font.Font(None, 36)  # Fuente por defecto, tamaño 36
         self.fuente_pequena = pygame.font.Font(None, 24)  # Fuente para instrucciones
+
+        # Caché de textos renderizados: (id fuente, texto, color) -> Surface
+        self._cache_textos: Dict[Tuple[int, str, Tuple[int, int, int]], pygame.Surface] = {}
+        self._max_cache_textos = 256
+
+        # Textos que nunca cambian se renderizan una sola vez
+        self._surf_instrucciones = self._rasterizar(
+            self.fuente_pequena,
+            "Mueve con mouse - Clic izquierdo para disparar - Recolecta monedas para mejoras",
+            (200, 200, 200))
+        self._surf_game_over = self._rasterizar(self.fuente, "GAME OVER", (255, 0, 0))
+        self._surf_reiniciar = self._rasterizar(
+            self.fuente_pequena, "Presiona ESPACIO o ENTER para reiniciar", (200, 200, 200))
+        self._surf_salir = self._rasterizar(
+            self.fuente_pequena, "Presiona ESC para salir", (150, 150, 150))
+
+        # Atlas de dígitos para los números del HUD, que cambian muy seguido:
+        # cada número se dibuja con blits de recortes en lugar de renderizarlo
+        self._atlas_hud = self._crear_atlas_digitos(self.fuente, (255, 255, 255))
+        self._atlas_progreso = self._crear_atlas_digitos(self.fuente_pequena, (200, 200, 200))
+
+        # Solo se encolan los eventos que maneja el juego; el resto (como
+        # MOUSEMOTION) se bloquea. La posición del mouse se lee bajo demanda
+        # con pygame.mouse.get_pos().
+        # Los eventos de ventana solo indican que hay que volver a consultar
+        # si la ventana se ve (ver manejar_eventos)
+        self._eventos_ventana = (pygame.WINDOWHIDDEN, pygame.WINDOWMINIMIZED,
+                                 pygame.WINDOWSHOWN, pygame.WINDOWRESTORED,
+                                 pygame.WINDOWMAXIMIZED, pygame.WINDOWEXPOSED)
+        self._eventos_manejados = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+                                   *self._eventos_ventana)
+        self._visible = True  # False mientras la ventana está minimizada u oculta
+        # Zonas de pantalla dibujadas en el frame anterior y en el actual: con
+        # el fondo estático basta con enviar a la ventana esas zonas
+        self._rects_previos: List[pygame.Rect] = []
+        self._rects_frame: List[pygame.Rect] = []
+        self._pantalla_completa = True  # El próximo frame debe enviarse entero
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self._eventos_manejados)
         
         self.clock = pygame.time.Clock()
         self.jugando = True
         self.game_over = False  # Estado específico de game over
         self.tiempo_desde_ultimo_dano = 0.0
         self.cooldown_dano = 1.0  # 1 segundo de cooldown para recibir daño
-        self.enemigos = []
+
+        # Paso de tiempo fijo para la lógica del juego (independiente del render)
+        self._acumulador = 0.0  # Tiempo real pendiente de simular
+        self._dt_fijo = 1 / 60  # Duración de cada paso de simulación en segundos
+        self._max_acumulado = 0.25  # Evita encadenar demasiados pasos tras una pausa larga
+        self._sucio = True  # Algo visible cambió desde el último pintar()
+        self.enemigos: List[Enemigo] = []  # Solo enemigos vivos (los eliminados se retiran al morir)
+        self._bajas_paso = 0  # Enemigos eliminados en el paso de lógica actual
+        self._pool_enemigos: List[Enemigo] = []  # Enemigos eliminados listos para reutilizar
         self.monedas = []  # Lista de monedas activas en el juego  
+        self._pool_monedas: List[Moneda] = []  # Monedas recolectadas o caducadas para reutilizar
         
 # ✅ Timers para controlar aparición de enemigos
         self.tiempo_enemigo = 0.0
         self.intervalo_enemigo = 5.0
 
+        # Actualización de enemigos en paralelo (solo en intérpretes sin GIL)
+        self._pool_hilos: Optional[ThreadPoolExecutor] = None
+        self._umbral_hilos = 64  # Enemigos mínimos para repartir entre hilos
+        self._n_hilos = os.cpu_count() or 1
+        self._hilos_disponibles = self._n_hilos > 1 and not _gil_activo()
+
+        # Posiciones y radios de aparición pre-generados por lotes: (x, y, radio)
+        self._apariciones: Deque[Tuple[int, int, int]] = deque()
+        self._tam_lote_apariciones = 256
+        self._tipos_moneda: Deque[str] = deque()  # Tipos de mejora pre-sorteados
+
+        # Rejilla espacial para acelerar colisiones proyectil-enemigo
+        # (celdas de 64 px, ~2 veces el radio medio de los enemigos)
+        self._rejilla = RejillaEspacial(self._ancho, self._alto, 64)
+        self._umbral_rejilla = 32  # Pares proyectil-enemigo mínimos para usar la rejilla
+        self._contactos: List[int] = []  # Salida de las consultas a la rejilla
+
+        # Copia de los enemigos en arreglos paralelos (x, y, radio) para el barrido
+        self._soa_x: List[float] = []
+        self._soa_y: List[float] = []
+        self._soa_r: List[int] = []
+        self._soa_enemigos: List[Enemigo] = []
+        self._paso = 0  # Número de paso de lógica actual
+        self._reloj = 0.0  # Tiempo de juego simulado en segundos
+        self._paso_soa = -1  # Paso en el que se copiaron los enemigos por última vez
+        self._soa_px: List[float] = []
+        self._soa_py: List[float] = []
+        self._soa_pr: List[int] = []
+        self._soa_proyectiles: List[Proyectil] = []
+        self._soa_mx: List[float] = []  # Monedas activas (x, y, radio)
+        self._soa_my: List[float] = []
+        self._soa_mr: List[int] = []
+        self._soa_monedas: List[Moneda] = []
+        self._pares_proyectil: List[int] = []  # Salida del barrido de colisiones
+        self._pares_enemigo: List[int] = []
+
         # Sistema de fondos por niveles
         self.fondos_nivel = []
         self.cargar_fondos_niveles()
@@ -101,7 +216,19 @@ class ControlJuego:
         Carga las imágenes de fondo para diferentes niveles.
         
         Intenta cargar múltiples fondos, si no existen usa el fondo por defecto.
+
+        Notes
+        -----
+        El fondo por defecto se carga y escala como mucho una vez: todos los
+        niveles sin imagen propia comparten la misma superficie. Un archivo
+        inexistente (OSError) se trata igual que uno que pygame no puede leer.
         """
+        tamano_pantalla = (self._ancho, self._alto)
+
+        def cargar(ruta: str) -> pygame.Surface:
+            imagen = pygame.image.load(ruta).convert(self.pantalla)
+            return pygame.transform.scale(imagen, tamano_pantalla)
+
         try:
             # Intentar cargar fondos específicos por nivel
             fondos_posibles = [
@@ -111,45 +238,39 @@ class ControlJuego:
                 "juego/static/fondo_nivel4.png",
                 "juego/static/fondo_nivel5.png"
             ]
+            fondo_defecto: Optional[pygame.Surface] = None
             
             for fondo_path in fondos_posibles:
                 try:
-                    imagen = pygame.image.load(fondo_path).convert()
-                    ancho_pantalla = self.pantalla.get_width()
-                    alto_pantalla = self.pantalla.get_height()
-                    fondo_escalado = pygame.transform.scale(imagen, (ancho_pantalla, alto_pantalla))
-                    self.fondos_nivel.append(fondo_escalado)
-                except pygame.error:
+                    self.fondos_nivel.append(cargar(fondo_path))
+                except (pygame.error, OSError):
                     # Si no existe el fondo específico, usar el fondo por defecto
-                    imagen = pygame.image.load("juego/static/image.png").convert()
-                    ancho_pantalla = self.pantalla.get_width()
-                    alto_pantalla = self.pantalla.get_height()
-                    fondo_escalado = pygame.transform.scale(imagen, (ancho_pantalla, alto_pantalla))
-                    self.fondos_nivel.append(fondo_escalado)
+                    if fondo_defecto is None:
+                        fondo_defecto = cargar("juego/static/image.png")
+                    self.fondos_nivel.append(fondo_defecto)
             
             # Si no se cargó ningún fondo, usar el fondo por defecto
             if not self.fondos_nivel:
-                imagen = pygame.image.load("juego/static/image.png").convert()
-                ancho_pantalla = self.pantalla.get_width()
-                alto_pantalla = self.pantalla.get_height()
-                fondo_escalado = pygame.transform.scale(imagen, (ancho_pantalla, alto_pantalla))
-                self.fondos_nivel.append(fondo_escalado)
+                self.fondos_nivel.append(cargar("juego/static/image.png"))
                 
-        except pygame.error:
+        except (pygame.error, OSError):
             # Fallback: crear un fondo sólido si no hay imágenes
-            ancho_pantalla = self.pantalla.get_width()
-            alto_pantalla = self.pantalla.get_height()
-            fondo_solido = pygame.Surface((ancho_pantalla, alto_pantalla))
+            fondo_solido = pygame.Surface(tamano_pantalla).convert(self.pantalla)
             fondo_solido.fill((0, 0, 50))  # Azul oscuro
             self.fondos_nivel.append(fondo_solido)
     
     def actualizar_fondo(self) -> None:
         """
         Actualiza el fondo actual basado en el nivel.
+
+        También prepara los argumentos del blit del fondo para que el
+        renderizado de cada frame no tenga que construirlos.
         """
         if self.fondos_nivel:
             indice_fondo = min(self.fondo_actual, len(self.fondos_nivel) - 1)
             self.fondo = self.fondos_nivel[indice_fondo]
+            self._fondo_blit = (self.fondo, (0, 0))
+            self._pantalla_completa = True
     
     def subir_nivel(self) -> None:
         """
@@ -163,6 +284,10 @@ class ControlJuego:
         # Aumentar dificultad
         self.intervalo_enemigo = max(2.0, self.intervalo_enemigo - 0.5)  # Enemigos más frecuentes
 
+        # El cambio de nivel es una pausa natural: recolectar aquí la generación
+        # joven en lugar de dejar que el GC automático interrumpa un frame
+        gc.collect(0)
+
     def inicializar_juego(self) -> None:
         """
         Configura los objetos iniciales del juego.
@@ -175,16 +300,14 @@ class ControlJuego:
         El jugador se coloca en la parte izquierda de la pantalla y el enemigo
         en la parte superior central para un gameplay balanceado.
         """
-        width = self.pantalla.get_width()
-        height = self.pantalla.get_height()
+        width = self._ancho
+        height = self._alto
 
         # Crear jugador (verde) en la parte izquierda de la pantalla
         self.jugador = Jugador(self.pantalla, width // 4, height // 2, (0, 255, 0))
         
         # Crear enemigo (rojo) en la parte superior central
-        enemigo_inicial = Enemigo(self.pantalla, width // 2, height // 4, (255, 0, 0))
-        enemigo_inicial.establecer_objetivo(self.jugador)
-        self.enemigos.append(enemigo_inicial)
+        self._crear_enemigo(width // 2, height // 4, 20)
       
     def manejar_eventos(self) -> None:
         """
@@ -198,13 +321,21 @@ class ControlJuego:
         - Clic izquierdo del mouse: disparar (solo si el juego está activo)
         - ESPACIO o ENTER: reiniciar juego (solo en Game Over)
         - QUIT: salir del juego
+        - Minimizar/ocultar o restaurar la ventana: pausa o reanuda el renderizado
+
+        La cola de SDL se bombea una sola vez por frame y después se extraen
+        de una vez solo los tipos de evento que se manejan aquí. La posición
+        del mouse no llega por eventos: `Jugador.actualizar` la lee con
+        `pygame.mouse.get_pos()`.
         """
-        for event in pygame.event.get():
+        pygame.event.pump()
+        for event in pygame.event.get(self._eventos_manejados, pump=False):
+            self._sucio = True
             if event.type == pygame.QUIT:
                 self.jugando = False
             elif event.type == pygame.KEYDOWN:
                 # Reiniciar juego con ESPACIO o ENTER cuando está en Game Over
-                if self.game_over and event.key in [pygame.K_SPACE, pygame.K_RETURN]:
+                if self.game_over and event.key in (pygame.K_SPACE, pygame.K_RETURN):
                     self.reiniciar_juego()
                 # Salir con ESC
                 elif event.key == pygame.K_ESCAPE:
@@ -212,6 +343,11 @@ class ControlJuego:
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1 and not self.game_over:  # Clic izquierdo solo si no es Game Over
                     self.jugador.disparar(event.pos)
+            elif event.type in self._eventos_ventana:
+                # get() filtrado agrupa los eventos por tipo y pierde su orden,
+                # así que se consulta el estado actual de la ventana
+                self._visible = pygame.display.get_active()
+                self._pantalla_completa = True
 
     def actualizar(self, dt: float) -> None:
         """
@@ -241,23 +377,27 @@ class ControlJuego:
         if not self.jugando:
             return
 
+        self._sucio = True
+        self._paso += 1
+        self._reloj += dt
+        self._bajas_paso = 0
+
+        # Referencias locales a los atributos que se consultan varias veces
+        jugador = self.jugador
+        enemigos = self.enemigos
+
         # 1. Actualizar cooldown de daño al jugador
         self.tiempo_desde_ultimo_dano += dt
-        self.tiempo_enemigo += dt
+        tiempo_enemigo = self.tiempo_enemigo + dt
         # Solo respawnear por tiempo si hay pocos enemigos activos
-        enemigos_activos = len([e for e in self.enemigos if e.activo])
-        if self.tiempo_enemigo >= self.intervalo_enemigo and enemigos_activos < 3:
-           self.respawnear_enemigo()
-           self.tiempo_enemigo = 0.0  # Resetear el timer
-          
-          
-        # 2. Actualizar objetos del juego
-        self.jugador.actualizar(dt)  # Actualizar jugador
-        for enemigo in self.enemigos:
-            if enemigo.activo:
-               enemigo.actualizar(dt)
-
+        if tiempo_enemigo >= self.intervalo_enemigo and len(enemigos) < 3:
+            self.respawnear_enemigo()
+            tiempo_enemigo = 0.0  # Resetear el timer
+        self.tiempo_enemigo = tiempo_enemigo
 
+        # 2. Actualizar objetos del juego
+        jugador.actualizar(dt)  # Actualizar jugador
+        self._actualizar_enemigos(dt)
 
         # 3. Verificar colisiones entre proyectiles y enemigo
         self._verificar_colisiones_proyectiles()
@@ -266,11 +406,8 @@ class ControlJuego:
         self._verificar_colision_jugador_enemigo()
 
         # 5. Respawnear enemigos destruidos (controlado)
-        enemigos_activos = len([e for e in self.enemigos if e.activo])
-        enemigos_inactivos = len([e for e in self.enemigos if not e.activo])
-        
-        # Solo respawnear si hay enemigos inactivos y no hay demasiados activos
-        if enemigos_inactivos > 0 and enemigos_activos < 5:
+        # Solo respawnear si hubo bajas y no hay demasiados enemigos activos
+        if self._bajas_paso > 0 and len(enemigos) < 5:
             # Solo respawnear un enemigo por frame
             self.respawnear_enemigo()
 
@@ -286,10 +423,81 @@ class ControlJuego:
         # 8. Verificar recolección de monedas
         self._verificar_recoleccion_monedas()
         
-        # 9. Eliminar enemigos inactivos, proyectiles inactivos y monedas inactivas
-        self.enemigos = [e for e in self.enemigos if e.activo]
-        self.jugador.proyectiles = [p for p in self.jugador.proyectiles if p.activo]
-        self.monedas = [m for m in self.monedas if m.activo]    
+        # 9. Eliminar proyectiles inactivos y monedas inactivas (a sus pools)
+        # (los enemigos inactivos ya se compactaron en el paso 5)
+        jugador.liberar_proyectiles_inactivos()
+        if self.monedas:
+            self._compactar(self.monedas, self._pool_monedas)
+
+    def _actualizar_enemigos(self, dt: float) -> None:
+        """
+        Actualiza todos los enemigos activos, repartiéndolos entre hilos si conviene.
+
+        Parameters
+        ----------
+        dt : float
+            Tiempo transcurrido desde la última actualización en segundos
+
+        Notes
+        -----
+        Cada enemigo solo modifica su propio estado (lee la posición del
+        jugador, que no cambia durante esta fase), así que las actualizaciones
+        son independientes. Con el GIL activo los hilos no aportan velocidad,
+        por lo que solo se usan en intérpretes sin GIL y con muchos enemigos.
+        """
+        enemigos = self.enemigos
+        if not self._hilos_disponibles or len(enemigos) < self._umbral_hilos:
+            for enemigo in enemigos:
+                enemigo.actualizar(dt)
+            return
+
+        if self._pool_hilos is None:
+            self._pool_hilos = ThreadPoolExecutor(max_workers=self._n_hilos)
+
+        tam_bloque = -(-len(enemigos) // self._n_hilos)  # División redondeando hacia arriba
+        bloques = [enemigos[i:i + tam_bloque] for i in range(0, len(enemigos), tam_bloque)]
+
+        def actualizar_bloque(bloque: List[Enemigo]) -> None:
+            for enemigo in bloque:
+                enemigo.actualizar(dt)
+
+        # Consumir el iterador para propagar cualquier excepción de los hilos
+        for _ in self._pool_hilos.map(actualizar_bloque, bloques):
+            pass
+
+    @staticmethod
+    def _compactar(lista: list, descartados: Optional[list] = None) -> int:
+        """
+        Elimina en el sitio los elementos inactivos de una lista de figuras.
+
+        Parameters
+        ----------
+        lista : list
+            Lista de figuras con atributo ``activo``
+        descartados : list, optional
+            Lista donde se guardan los elementos retirados (por ejemplo, un pool
+            para reutilizarlos). Si es None simplemente se descartan.
+
+        Returns
+        -------
+        int
+            Cantidad de elementos activos que quedan en la lista
+
+        Notes
+        -----
+        Usa dos índices (lectura y escritura) para conservar el orden de los
+        elementos activos sin crear una lista nueva en cada frame.
+        """
+        escritura = 0
+        for lectura in range(len(lista)):
+            elemento = lista[lectura]
+            if elemento.activo:
+                lista[escritura] = elemento
+                escritura += 1
+            elif descartados is not None:
+                descartados.append(elemento)
+        del lista[escritura:]
+        return escritura
 
     def _verificar_colisiones_proyectiles(self) -> None:
         """
@@ -300,27 +508,169 @@ class ControlJuego:
 
         Notes
         -----
-        Se itera sobre una copia de la lista de proyectiles para evitar problemas
-        al modificar la lista durante la iteración.
-        """
-        for proyectil in self.jugador.proyectiles[:]:  # Copia para iteración segura
-            for enemigo in self.enemigos:
-                if proyectil.colision(enemigo):
-                   if enemigo.recibir_dano():
-                        # Verificar si el enemigo fue completamente eliminado
-                        if not enemigo.activo:
-                            self.puntos += 1  # +1 punto por eliminar completamente al enemigo
-                            self.enemigos_eliminados_nivel += 1
-                            
-                            # Generar moneda de recompensa
-                            self._generar_moneda_recompensa(enemigo.x, enemigo.y)
-                            
-                            # Verificar si se debe subir de nivel
-                            if self.enemigos_eliminados_nivel >= self.enemigos_para_siguiente_nivel:
-                                self.subir_nivel()
-                        else:
-                            self.puntos += 0  # No hay puntos por solo golpear
-                   proyectil.activo = False
+        Los impactos solo desactivan proyectiles; la lista se compacta al final
+        de `actualizar`, así que se puede recorrer sin copiarla.
+        El coste de la fuerza bruta es proporcional al número de pares
+        proyectil-enemigo. Cuando supera `_umbral_rejilla` se usa una rejilla
+        espacial para probar cada proyectil solo contra los enemigos de las
+        celdas cercanas.
+        """
+        proyectiles = self.jugador.proyectiles
+        n_pares = len(self.enemigos) * len(proyectiles)
+        if n_pares == 0:
+            return
+
+        aplicar_impacto = self._aplicar_impacto
+        self._actualizar_soa_enemigos()
+        if n_pares < self._umbral_rejilla:
+            self._actualizar_soa_proyectiles()
+            pares_proyectil = self._pares_proyectil
+            pares_enemigo = self._pares_enemigo
+            soa_proyectiles = self._soa_proyectiles
+            soa_enemigos = self._soa_enemigos
+            pares = colisionar(self._soa_x, self._soa_y, self._soa_r,
+                               self._soa_px, self._soa_py, self._soa_pr,
+                               pares_proyectil, pares_enemigo)
+            for k in range(pares):
+                proyectil = soa_proyectiles[pares_proyectil[k]]
+                enemigo = soa_enemigos[pares_enemigo[k]]
+                # Cada proyectil impacta una sola vez, y un enemigo eliminado
+                # por un proyectil anterior ya no cuenta
+                if proyectil.activo and enemigo.activo:
+                    aplicar_impacto(proyectil, enemigo)
+            return
+
+        self._rejilla.construir(self._soa_x, self._soa_y, self._soa_r)
+        buscar_impacto = self._buscar_impacto_en_rejilla
+        for proyectil in proyectiles:
+            if not proyectil.activo:
+                continue
+
+            enemigo = buscar_impacto(proyectil)
+            if enemigo is not None:
+                aplicar_impacto(proyectil, enemigo)
+
+    def _actualizar_soa_enemigos(self) -> None:
+        """
+        Copia posición y radio de los enemigos activos a arreglos paralelos.
+
+        Notes
+        -----
+        El barrido de colisiones (`colisionar`), la rejilla espacial y la
+        colisión con el jugador trabajan con estos arreglos de números. Las
+        listas se reutilizan entre frames, y la copia de enemigos no cambia
+        aunque alguno muera al procesar los impactos. Como los enemigos solo
+        se mueven en `_actualizar_enemigos`, la copia se hace como mucho una
+        vez por paso de lógica, la primera vez que alguien la necesita.
+        """
+        if self._paso_soa == self._paso:
+            return
+        self._paso_soa = self._paso
+
+        self._soa_x.clear()
+        self._soa_y.clear()
+        self._soa_r.clear()
+        self._soa_enemigos.clear()
+        for enemigo in self.enemigos:
+            self._soa_x.append(enemigo.posicion.x)
+            self._soa_y.append(enemigo.posicion.y)
+            self._soa_r.append(enemigo.radio)
+            self._soa_enemigos.append(enemigo)
+
+    def _actualizar_soa_proyectiles(self) -> None:
+        """
+        Copia posición y radio de los proyectiles activos a arreglos paralelos.
+        """
+        self._soa_px.clear()
+        self._soa_py.clear()
+        self._soa_pr.clear()
+        self._soa_proyectiles.clear()
+        for proyectil in self.jugador.proyectiles:
+            if proyectil.activo:
+                self._soa_px.append(proyectil.posicion.x)
+                self._soa_py.append(proyectil.posicion.y)
+                self._soa_pr.append(proyectil.radio)
+                self._soa_proyectiles.append(proyectil)
+
+    def _buscar_impacto_en_rejilla(self, proyectil: Proyectil) -> Optional[Enemigo]:
+        """
+        Busca en la rejilla espacial el primer enemigo alcanzado por un proyectil.
+
+        Parameters
+        ----------
+        proyectil : Proyectil
+            Proyectil cuyo entorno se consulta
+
+        Returns
+        -------
+        Optional[Enemigo]
+            Enemigo activo que colisiona con el proyectil, o None si no hay ninguno
+
+        Notes
+        -----
+        Si el proyectil toca a varios enemigos se elige el de menor índice, el
+        mismo que encontraría el barrido por fuerza bruta.
+        """
+        contactos = self._contactos
+        if not self._rejilla.contactos(proyectil.posicion.x, proyectil.posicion.y,
+                                       proyectil.radio, contactos):
+            return None
+
+        enemigos = self._soa_enemigos
+        mejor = -1
+        for j in contactos:
+            if enemigos[j].activo and (mejor < 0 or j < mejor):
+                mejor = j
+        return enemigos[mejor] if mejor >= 0 else None
+
+    def _aplicar_impacto(self, proyectil: Proyectil, enemigo: Enemigo) -> None:
+        """
+        Aplica el efecto de un proyectil que alcanzó a un enemigo.
+
+        Parameters
+        ----------
+        proyectil : Proyectil
+            Proyectil que impactó (se desactiva)
+        enemigo : Enemigo
+            Enemigo alcanzado por el proyectil
+        """
+        if enemigo.recibir_dano():
+            # Verificar si el enemigo fue completamente eliminado
+            if not enemigo.activo:
+                self._marcar_eliminado(enemigo)
+                self.puntos += 1  # +1 punto por eliminar completamente al enemigo
+                self.enemigos_eliminados_nivel += 1
+
+                # Generar moneda de recompensa
+                self._generar_moneda_recompensa(enemigo.x, enemigo.y)
+
+                # Verificar si se debe subir de nivel
+                if self.enemigos_eliminados_nivel >= self.enemigos_para_siguiente_nivel:
+                    self.subir_nivel()
+            else:
+                self.puntos += 0  # No hay puntos por solo golpear
+        proyectil.activo = False
+
+    def _marcar_eliminado(self, enemigo: Enemigo) -> None:
+        """
+        Retira un enemigo recién eliminado de la lista y lo guarda en el pool.
+
+        Parameters
+        ----------
+        enemigo : Enemigo
+            Enemigo cuya vida llegó a cero
+
+        Notes
+        -----
+        Así `enemigos` solo contiene enemigos vivos y los bucles de
+        actualización y dibujo no necesitan comprobar `activo`. Las colisiones
+        del paso en curso recorren su copia en arreglos, que no cambia al
+        retirar enemigos. Las bajas se cuentan en `_bajas_paso` para que
+        `actualizar` sepa si hay que respawnear.
+        """
+        self.enemigos.remove(enemigo)
+        self._pool_enemigos.append(enemigo)
+        self._bajas_paso += 1
 
     def _verificar_colision_jugador_enemigo(self) -> None:
         """
@@ -328,13 +678,31 @@ class ControlJuego:
 
         El jugador recibe daño si colisiona con el enemigo y ha pasado el cooldown
         de daño establecido. Cada colisión reduce un punto.
+
+        Notes
+        -----
+        Como el primer impacto reinicia el cooldown, como mucho se aplica un
+        daño por frame; mientras el cooldown está activo no se recorre la lista.
+        La prueba usa la misma copia en arreglos (`_actualizar_soa_enemigos`)
+        que las colisiones de proyectiles.
         """
-        for enemigo in self.enemigos:
-           if (self.jugador.colision(enemigo) and 
-              self.tiempo_desde_ultimo_dano >= self.cooldown_dano):
-            
-              self.puntos -= 2
-              self.tiempo_desde_ultimo_dano = 0.0
+        jugador = self.jugador
+        if not jugador.activo or self.tiempo_desde_ultimo_dano < self.cooldown_dano:
+            return
+
+        self._actualizar_soa_enemigos()
+        xs, ys, rs = self._soa_x, self._soa_y, self._soa_r
+        enemigos = self._soa_enemigos
+        jx = jugador.posicion.x
+        jy = jugador.posicion.y
+        jr = jugador.radio
+        j = primer_contacto(xs, ys, rs, jx, jy, jr)
+        # Saltar enemigos eliminados por un proyectil en este mismo paso
+        while j >= 0 and not enemigos[j].activo:
+            j = primer_contacto(xs, ys, rs, jx, jy, jr, j + 1)
+        if j >= 0:
+            self.puntos -= 2
+            self.tiempo_desde_ultimo_dano = 0.0
 
     def respawnear_enemigo(self) -> None:
         """
@@ -348,16 +716,84 @@ class ControlJuego:
         La posición aleatoria evita que el enemigo aparezca demasiado cerca
         de los bordes de la pantalla (margen de 50 píxeles).
         """
-        width = self.pantalla.get_width()
-        height = self.pantalla.get_height()
-        
-        # Generar posición aleatoria con margen de seguridad
-        x = random.randint(50, width - 50)
-        y = random.randint(50, height - 50)
+        if not self._apariciones:
+            self._rellenar_apariciones()
+        x, y, radio = self._apariciones.popleft()
+
+        self._crear_enemigo(x, y, radio)
+
+    def _crear_enemigo(self, x: float, y: float, radio: int) -> Enemigo:
+        """
+        Pone en juego un enemigo rojo que persigue al jugador.
 
-        nuevo = Enemigo(self.pantalla, x, y, (255, 0, 0), radio=random.choice([10,15,20,25,30]))
+        Parameters
+        ----------
+        x : float
+            Posición horizontal del enemigo
+        y : float
+            Posición vertical del enemigo
+        radio : int
+            Radio del enemigo en píxeles
+
+        Returns
+        -------
+        Enemigo
+            El enemigo añadido al juego
+
+        Notes
+        -----
+        Reutiliza un enemigo eliminado del pool si hay alguno disponible;
+        solo construye uno nuevo cuando el pool está vacío.
+        """
+        if self._pool_enemigos:
+            nuevo = self._pool_enemigos.pop()
+            nuevo.reset(x, y, (255, 0, 0), radio)
+        else:
+            nuevo = Enemigo(self.pantalla, x, y, (255, 0, 0), radio=radio)
         nuevo.establecer_objetivo(self.jugador)
         self.enemigos.append(nuevo)
+        return nuevo
+
+    def _rellenar_apariciones(self) -> None:
+        """
+        Genera un lote de posiciones y radios aleatorios para futuros respawns.
+
+        Notes
+        -----
+        Las posiciones mantienen un margen de 50 píxeles con los bordes de la
+        pantalla. Cada valor sale de un único `random.getrandbits(16)` escalado
+        al rango deseado (`(bits * tamaño) >> 16`), más barato que el muestreo
+        con rechazo de `random.randint`. El sesgo es despreciable mientras el
+        rango sea mucho menor que 65536.
+        """
+        width = self._ancho
+        height = self._alto
+        bits = random.getrandbits
+        radios = (10, 15, 20, 25, 30)
+
+        # Generar posiciones aleatorias con margen de seguridad (50..tamaño-50)
+        rango_x = width - 99
+        rango_y = height - 99
+        self._apariciones.extend(
+            (50 + ((bits(16) * rango_x) >> 16),
+             50 + ((bits(16) * rango_y) >> 16),
+             radios[(bits(16) * 5) >> 16])
+            for _ in range(self._tam_lote_apariciones))
+
+    def _rellenar_tipos_moneda(self) -> None:
+        """
+        Sortea por lotes el tipo de mejora de las próximas monedas.
+
+        Notes
+        -----
+        Usa el mismo escalado de `random.getrandbits(16)` que
+        `_rellenar_apariciones`, en lugar de un `random.choice` por moneda.
+        """
+        bits = random.getrandbits
+        tipos = Moneda.TIPOS_MEJORA
+        n_tipos = len(tipos)
+        self._tipos_moneda.extend(
+            tipos[(bits(16) * n_tipos) >> 16] for _ in range(self._tam_lote_apariciones))
 
     def _generar_moneda_recompensa(self, x: float, y: float) -> None:
         """
@@ -373,8 +809,17 @@ class ControlJuego:
         # Determinar el valor de la moneda basado en el nivel
         valor_base = min(3, self.nivel_actual // 2 + 1)  # Más valor en niveles altos
         
-        # Crear moneda con tipo aleatorio
-        moneda = Moneda(self.pantalla, x, y, tipo_mejora=None, valor_mejora=valor_base)
+        # Crear moneda con tipo aleatorio (sorteado por lotes)
+        if not self._tipos_moneda:
+            self._rellenar_tipos_moneda()
+        tipo = self._tipos_moneda.popleft()
+        # (se reutiliza una moneda del pool si hay alguna disponible)
+        if self._pool_monedas:
+            moneda = self._pool_monedas.pop()
+            moneda.reset(x, y, tipo, valor_base, self._reloj)
+        else:
+            moneda = Moneda(self.pantalla, x, y, tipo_mejora=tipo, valor_mejora=valor_base,
+                            instante=self._reloj)
         self.monedas.append(moneda)
 
     def _actualizar_monedas(self, dt: float) -> None:
@@ -385,32 +830,65 @@ class ControlJuego:
         ----------
         dt : float
             Tiempo transcurrido desde la última actualización en segundos
+
+        Notes
+        -----
+        Las monedas reciben el reloj del juego (ya avanzado en `dt`) para
+        comprobar si caducan.
         """
+        ahora = self._reloj
         for moneda in self.monedas:
             if moneda.activo:
-                moneda.actualizar(dt)
+                moneda.actualizar(ahora)
 
     def _verificar_recoleccion_monedas(self) -> None:
         """
         Verifica si el jugador ha recolectado alguna moneda y aplica las mejoras.
+
+        Notes
+        -----
+        Las monedas activas se copian a arreglos paralelos y el contacto con el
+        jugador se busca con `primer_contacto`, igual que con los enemigos.
+        `recolectar` desactiva la moneda y la compactación del final de
+        `actualizar` la retira de la lista, así que aquí no se modifica.
         """
-        for moneda in self.monedas[:]:  # Copia para iteración segura
-            if moneda.activo and self.jugador.colision(moneda):
-                # Recolectar la moneda
-                mejora = moneda.recolectar()
-                
-                # Aplicar la mejora al jugador
-                mensaje = self.jugador.aplicar_mejora(mejora['tipo'], mejora['valor'])
-                
-                # Añadir puntos si corresponde
-                if mejora['puntos'] > 0:
-                    self.puntos += mejora['puntos']
-                
-                # Mostrar mensaje de mejora (opcional - se puede implementar en UI)
-                print(f"¡{mensaje}")
-                
-                # Remover la moneda de la lista
-                self.monedas.remove(moneda)
+        jugador = self.jugador
+        if not jugador.activo or not self.monedas:
+            return
+
+        xs, ys, rs = self._soa_mx, self._soa_my, self._soa_mr
+        monedas = self._soa_monedas
+        xs.clear()
+        ys.clear()
+        rs.clear()
+        monedas.clear()
+        for moneda in self.monedas:
+            if moneda.activo:
+                xs.append(moneda.posicion.x)
+                ys.append(moneda.posicion.y)
+                rs.append(moneda.radio)
+                monedas.append(moneda)
+
+        jx = jugador.posicion.x
+        jy = jugador.posicion.y
+        jr = jugador.radio
+        j = primer_contacto(xs, ys, rs, jx, jy, jr)
+        while j >= 0:
+            moneda = monedas[j]
+            j = primer_contacto(xs, ys, rs, jx, jy, jr, j + 1)
+
+            # Recolectar la moneda
+            mejora = moneda.recolectar()
+            
+            # Aplicar la mejora al jugador
+            mensaje = jugador.aplicar_mejora(mejora['tipo'], mejora['valor'])
+            
+            # Añadir puntos si corresponde
+            if mejora['puntos'] > 0:
+                self.puntos += mejora['puntos']
+            
+            # Mostrar mensaje de mejora (opcional - se puede implementar en UI)
+            print(f"¡{mensaje}")
 
     def reiniciar_juego(self) -> None:
         """
@@ -421,6 +899,7 @@ class ControlJuego:
         """
         # Resetear estado del juego
         self.game_over = False
+        self._sucio = True
         self.jugando = True
         self.puntos = 10
         
@@ -434,8 +913,10 @@ class ControlJuego:
         self.fondo_actual = 0
         self.actualizar_fondo()
         
-        # Limpiar listas
+        # Limpiar listas (enemigos y monedas pasan a su pool para reutilizarlos)
+        self._pool_enemigos.extend(self.enemigos)
         self.enemigos.clear()
+        self._pool_monedas.extend(self.monedas)
         self.monedas.clear()
         if self.jugador:
             self.jugador.proyectiles.clear()
@@ -468,19 +949,39 @@ class ControlJuego:
         -----
         La pantalla se limpia completamente en cada frame antes de dibujar.
         El orden de renderizado es importante para la superposición de elementos.
+        Si nada visible cambió desde la última llamada (`_sucio` es False), no
+        se dibuja ni se hace flip: la imagen anterior sigue siendo válida.
+        Durante la partida el fondo no cambia entre frames, así que solo se
+        envían a la ventana las zonas dibujadas en este frame y en el anterior
+        (donde había algo que ahora hay que borrar). La pantalla completa se
+        envía al empezar, al cambiar de fondo, al volver a mostrarse la ventana
+        y fuera de la partida.
         """
+        if not self._sucio:
+            return
+
         # Limpiar pantalla con color negro
         self.pantalla.fill((0, 0, 0))
 
+        rects = self._rects_frame
+        rects.clear()
         if self.jugando:
-            self._pintar_juego_activo()
+            self._pintar_juego_activo(rects)
         elif self.game_over:
             self._pintar_game_over()
 
-        # Actualizar la pantalla completa
-        pygame.display.flip()
+        if self._pantalla_completa or not self.jugando:
+            # Actualizar la pantalla completa
+            pygame.display.flip()
+            self._pantalla_completa = not self.jugando
+        else:
+            # Actualizar solo las zonas que cambiaron
+            self._rects_previos.extend(rects)
+            pygame.display.update(self._rects_previos)
+        self._rects_previos, self._rects_frame = rects, self._rects_previos
+        self._sucio = False
 
-    def _pintar_juego_activo(self) -> None:
+    def _pintar_juego_activo(self, rects: List[pygame.Rect]) -> None:
         """
         Renderiza la interfaz del juego cuando está activo.
 
@@ -489,59 +990,197 @@ class ControlJuego:
         - Proyectiles
         - Información de puntos
         - Instrucciones de control
+
+        Parameters
+        ----------
+        rects : List[pygame.Rect]
+            Lista a la que se añaden las zonas de pantalla dibujadas sobre el fondo
         """
         # ✅ Dibujar imagen de fondo
-        self.pantalla.blit(self.fondo, (0, 0))
+        self.pantalla.blit(*self._fondo_blit)
         
         # Pintar objetos del juego
-        self.jugador.pintar()
-        for enemigo in self.enemigos:
-             if enemigo.activo:
-                enemigo.pintar()
+        self.jugador.pintar(rects)
+        Figura.pintar_muchos(self.pantalla, self.enemigos, rects)
         
         # Pintar monedas
         for moneda in self.monedas:
             if moneda.activo:
-                moneda.pintar()
-
-        # Mostrar información del juego
-        texto_puntos = self.fuente.render(f"Puntos: {self.puntos}", True, (255, 255, 255))
-        self.pantalla.blit(texto_puntos, (10, 10))
+                moneda.pintar(rects)
+
+        # Mostrar información del juego (todo el HUD se envía en un solo blits).
+        # Las etiquetas salen de la caché de textos y los números del atlas.
+        hud = []
+        blanco = (255, 255, 255)
+        etiqueta = self._renderizar_texto(self.fuente, "Puntos: ", blanco)
+        hud.append((etiqueta, (10, 10)))
+        self._pintar_numero(self._atlas_hud, self.puntos, 10 + etiqueta.get_width(), 10, hud)
         
         # Mostrar nivel actual
-        texto_nivel = self.fuente.render(f"Nivel: {self.nivel_actual}", True, (255, 255, 255))
-        self.pantalla.blit(texto_nivel, (10, 50))
+        etiqueta = self._renderizar_texto(self.fuente, "Nivel: ", blanco)
+        hud.append((etiqueta, (10, 50)))
+        self._pintar_numero(self._atlas_hud, self.nivel_actual, 10 + etiqueta.get_width(), 50, hud)
         
-        # Mostrar progreso hacia siguiente nivel
-        progreso = f"Enemigos: {self.enemigos_eliminados_nivel}/{self.enemigos_para_siguiente_nivel}"
-        texto_progreso = self.fuente_pequena.render(progreso, True, (200, 200, 200))
-        self.pantalla.blit(texto_progreso, (10, 90))
-
-        # Mostrar mejoras del jugador
-        mejoras = self.jugador.obtener_estado_mejoras()
+        # Mostrar progreso hacia siguiente nivel ("Enemigos: N/M")
+        gris = (200, 200, 200)
+        etiqueta = self._renderizar_texto(self.fuente_pequena, "Enemigos: ", gris)
+        hud.append((etiqueta, (10, 90)))
+        x = self._pintar_numero(self._atlas_progreso, self.enemigos_eliminados_nivel,
+                                10 + etiqueta.get_width(), 90, hud)
+        barra = self._renderizar_texto(self.fuente_pequena, "/", gris)
+        hud.append((barra, (x, 90)))
+        self._pintar_numero(self._atlas_progreso, self.enemigos_para_siguiente_nivel,
+                            x + barra.get_width(), 90, hud)
+
+        # Mostrar mejoras del jugador (se lee el diccionario sin copiarlo)
+        jugador = self.jugador
+        formatos = self._FORMATO_MEJORAS
         y_offset = 120
-        for tipo_mejora, valor in mejoras.items():
+        for tipo_mejora, valor in jugador.mejoras.items():
             if valor != 1.0 and valor != 0:  # Solo mostrar mejoras aplicadas
-                nombre_mejora = tipo_mejora.replace('_', ' ').title()
-                if tipo_mejora == 'velocidad_misil':
-                    texto_mejora = f"Velocidad Misiles: {valor:.1f}x"
-                elif tipo_mejora == 'daño_misil':
-                    texto_mejora = f"Daño Extra: +{valor}"
+                formato = formatos.get(tipo_mejora)
+                if formato is None:
+                    nombre_mejora = tipo_mejora.replace('_', ' ').title()
+                    texto_mejora = f"{nombre_mejora}: {valor}"
                 elif tipo_mejora == 'rapidez_disparo':
-                    texto_mejora = f"Cooldown: {self.jugador.cooldown_disparo:.2f}s"
-                elif tipo_mejora == 'puntos_extra':
-                    texto_mejora = f"Puntos Extra: +{valor}"
+                    texto_mejora = formato.format(jugador.cooldown_disparo)
                 else:
-                    texto_mejora = f"{nombre_mejora}: {valor}"
+                    texto_mejora = formato.format(valor)
                 
-                texto_mejora_render = self.fuente_pequena.render(texto_mejora, True, (100, 255, 100))
-                self.pantalla.blit(texto_mejora_render, (10, y_offset))
+                texto_mejora_render = self._renderizar_texto(
+                    self.fuente_pequena, texto_mejora, (100, 255, 100))
+                hud.append((texto_mejora_render, (10, y_offset)))
                 y_offset += 20
 
         # Mostrar instrucciones de control
-        texto_instrucciones = self.fuente_pequena.render(
-            "Mueve con mouse - Clic izquierdo para disparar - Recolecta monedas para mejoras", True, (200, 200, 200))
-        self.pantalla.blit(texto_instrucciones, (10, y_offset + 10))
+        hud.append((self._surf_instrucciones, (10, y_offset + 10)))
+
+        rects.extend(self.pantalla.blits(hud))
+
+    def _crear_atlas_digitos(self, fuente: pygame.font.Font, color: Tuple[int, int, int]
+                             ) -> Tuple[pygame.Surface, Dict[str, pygame.Rect]]:
+        """
+        Renderiza una sola vez los dígitos (y el signo menos) en una superficie.
+
+        Parameters
+        ----------
+        fuente : pygame.font.Font
+            Fuente con la que se renderizan los caracteres
+        color : Tuple[int, int, int]
+            Color RGB de los caracteres
+
+        Returns
+        -------
+        Tuple[pygame.Surface, Dict[str, pygame.Rect]]
+            Superficie con todos los caracteres en fila y el rectángulo que
+            ocupa cada carácter dentro de ella
+        """
+        glifos = [(c, fuente.render(c, True, color)) for c in "0123456789-"]
+        ancho = sum(glifo.get_width() for _, glifo in glifos)
+        alto = max(glifo.get_height() for _, glifo in glifos)
+
+        atlas = pygame.Surface((ancho, alto), pygame.SRCALPHA)
+        rects: Dict[str, pygame.Rect] = {}
+        x = 0
+        for c, glifo in glifos:
+            atlas.blit(glifo, (x, 0))
+            rects[c] = pygame.Rect(x, 0, glifo.get_width(), glifo.get_height())
+            x += glifo.get_width()
+        return atlas.convert_alpha(self.pantalla), rects
+
+    @staticmethod
+    def _pintar_numero(atlas: Tuple[pygame.Surface, Dict[str, pygame.Rect]], n: int,
+                       x: int, y: int, destino: list) -> int:
+        """
+        Añade a una lista de blits los glifos necesarios para dibujar un entero.
+
+        Parameters
+        ----------
+        atlas : Tuple[pygame.Surface, Dict[str, pygame.Rect]]
+            Atlas creado con `_crear_atlas_digitos`
+        n : int
+            Número a dibujar
+        x, y : int
+            Esquina superior izquierda donde empieza el número
+        destino : list
+            Lista de tuplas (superficie, posición, área) para `Surface.blits`
+
+        Returns
+        -------
+        int
+            Coordenada x justo después del último dígito
+
+        Notes
+        -----
+        No crea superficies nuevas: cada dígito es un recorte del atlas, así
+        que el coste no depende de cuántas veces cambie el número.
+        """
+        superficie, rects = atlas
+        for c in str(int(n)):
+            area = rects[c]
+            destino.append((superficie, (x, y), area))
+            x += area.width
+        return x
+
+    def _rasterizar(self, fuente: pygame.font.Font, texto: str,
+                    color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Renderiza un texto en el formato de píxeles de la pantalla.
+
+        Parameters
+        ----------
+        fuente : pygame.font.Font
+            Fuente con la que se renderiza el texto
+        texto : str
+            Texto a mostrar
+        color : Tuple[int, int, int]
+            Color RGB del texto
+
+        Returns
+        -------
+        pygame.Surface
+            Superficie con canal alfa convertida al formato de `pantalla`
+
+        Notes
+        -----
+        Con el mismo formato que la pantalla, los blits del HUD no tienen que
+        convertir cada píxel en cada frame.
+        """
+        return fuente.render(texto, True, color).convert_alpha(self.pantalla)
+
+    def _renderizar_texto(self, fuente: pygame.font.Font, texto: str,
+                          color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Devuelve la superficie de un texto, renderizándolo solo la primera vez.
+
+        Parameters
+        ----------
+        fuente : pygame.font.Font
+            Fuente con la que se renderiza el texto
+        texto : str
+            Texto a mostrar
+        color : Tuple[int, int, int]
+            Color RGB del texto
+
+        Returns
+        -------
+        pygame.Surface
+            Superficie con el texto renderizado
+
+        Notes
+        -----
+        Los textos del HUD solo cambian cuando cambia el valor que muestran,
+        así que la mayoría de los frames reutilizan una superficie ya creada.
+        La caché se vacía al superar su tamaño máximo para no crecer sin límite.
+        """
+        clave = (id(fuente), texto, color)
+        superficie = self._cache_textos.get(clave)
+        if superficie is None:
+            if len(self._cache_textos) >= self._max_cache_textos:
+                self._cache_textos.clear()
+            superficie = self._rasterizar(fuente, texto, color)
+            self._cache_textos[clave] = superficie
+        return superficie
 
     def _pintar_game_over(self) -> None:
         """
@@ -553,31 +1192,31 @@ class ControlJuego:
         - Instrucciones para reiniciar
         """
         # Texto principal de Game Over
-        texto_game_over = self.fuente.render("GAME OVER", True, (255, 0, 0))
+        texto_game_over = self._surf_game_over
         texto_rect = texto_game_over.get_rect(
-            center=(self.pantalla.get_width() // 2, self.pantalla.get_height() // 2 - 60))
-        self.pantalla.blit(texto_game_over, texto_rect)
+            center=(self._centro_x, self._centro_y - 60))
+        lineas = [(texto_game_over, texto_rect)]
 
         # Puntuación final
-        texto_puntos_final = self.fuente.render(
-            f"Puntos finales: {self.puntos}", True, (255, 255, 255))
+        texto_puntos_final = self._renderizar_texto(
+            self.fuente, f"Puntos finales: {self.puntos}", (255, 255, 255))
         puntos_rect = texto_puntos_final.get_rect(
-            center=(self.pantalla.get_width() // 2, self.pantalla.get_height() // 2 - 20))
-        self.pantalla.blit(texto_puntos_final, puntos_rect)
+            center=(self._centro_x, self._centro_y - 20))
+        lineas.append((texto_puntos_final, puntos_rect))
         
         # Instrucciones para reiniciar
-        texto_reiniciar = self.fuente_pequena.render(
-            "Presiona ESPACIO o ENTER para reiniciar", True, (200, 200, 200))
+        texto_reiniciar = self._surf_reiniciar
         reiniciar_rect = texto_reiniciar.get_rect(
-            center=(self.pantalla.get_width() // 2, self.pantalla.get_height() // 2 + 20))
-        self.pantalla.blit(texto_reiniciar, reiniciar_rect)
+            center=(self._centro_x, self._centro_y + 20))
+        lineas.append((texto_reiniciar, reiniciar_rect))
         
         # Instrucciones para salir
-        texto_salir = self.fuente_pequena.render(
-            "Presiona ESC para salir", True, (150, 150, 150))
+        texto_salir = self._surf_salir
         salir_rect = texto_salir.get_rect(
-            center=(self.pantalla.get_width() // 2, self.pantalla.get_height() // 2 + 50))
-        self.pantalla.blit(texto_salir, salir_rect)
+            center=(self._centro_x, self._centro_y + 50))
+        lineas.append((texto_salir, salir_rect))
+
+        self.pantalla.blits(lineas, doreturn=False)
 
     def ejecutar(self) -> None:
         """
@@ -589,27 +1228,53 @@ class ControlJuego:
 
         Notes
         -----
-        El juego se ejecuta a aproximadamente 60 FPS.
+        El juego se ejecuta a aproximadamente 60 FPS. Mientras la ventana está
+        minimizada u oculta no se dibuja y el bucle baja a 10 FPS; la lógica
+        sigue avanzando con el mismo paso fijo.
+        La lógica avanza en pasos de duración fija (`_dt_fijo`): el tiempo real de
+        cada frame se suma a un acumulador y se ejecutan tantos pasos como quepan.
+        Así un frame lento no produce un `dt` grande que desestabilice colisiones.
+        Solo se vuelve a dibujar si un paso de lógica o un evento marcó la
+        pantalla como sucia (ver `pintar`). La pantalla de Game Over es
+        estática, así que se dibuja una sola vez al entrar en ese estado.
         El juego no se cierra automáticamente, permite reiniciar desde Game Over.
+        El recolector de basura automático se desactiva durante el bucle para
+        evitar pausas a mitad de frame; la recolección se hace al subir de nivel
+        (ver `subir_nivel`). En PyPy, el tamaño de la nursery del GC se puede
+        ajustar con la variable de entorno PYPY_GC_NURSERY (por ejemplo, 1m).
         """
+        gc.disable()
         try:
             while self.jugando or self.game_over:
-                # Calcular delta time (tiempo transcurrido desde el último frame)
-                dt = self.clock.tick(60) / 1000.0  # Convertir milisegundos a segundos
+                # Calcular delta time (tiempo transcurrido desde el último frame).
+                # Con la ventana oculta el bucle se ralentiza a 10 FPS.
+                fps = 60 if self._visible else 10
+                dt = self.clock.tick(fps) / 1000.0  # Convertir milisegundos a segundos
 
                 # Procesar eventos de entrada
                 self.manejar_eventos()
 
-                # Actualizar lógica del juego si está activo
+                # Actualizar lógica del juego en pasos fijos si está activo
                 if self.jugando:
-                    self.actualizar(dt)
+                    self._acumulador = min(self._acumulador + dt, self._max_acumulado)
+                    while self._acumulador >= self._dt_fijo and self.jugando:
+                        self.actualizar(self._dt_fijo)
+                        self._acumulador -= self._dt_fijo
+                else:
+                    self._acumulador = 0.0
 
-                # Renderizar frame actual
-                self.pintar()
+                # Renderizar frame actual (no hace nada si no cambió nada);
+                # con la ventana minimizada el resultado no se vería
+                if self._visible:
+                    self.pintar()
 
         except Exception as e:
             print(f"Error durante la ejecución del juego: {e}")
         finally:
+            gc.enable()
+            if self._pool_hilos is not None:
+                self._pool_hilos.shutdown()
+                self._pool_hilos = None
             pygame.quit()
 
     def __repr__(self) -> str:
@@ -628,7 +1293,7 @@ class ControlJuego:
         else:
             estado = "inactivo"
         jugador_activo = self.jugador.activo if self.jugador else "no inicializado"
-        enemigos_activos = len([e for e in self.enemigos if e.activo]) if self.enemigos else 0
+        enemigos_activos = len(self.enemigos)
         
         return (f"ControlJuego(puntos={self.puntos}, estado={estado}, "
                 f"jugador={jugador_activo}, enemigos_activos={enemigos_activos})")
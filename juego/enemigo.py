@@ -94,6 +94,48 @@ class Enemigo(Figura):
         self.tiempo_invulnerable = 0.0  # Tiempo de invulnerabilidad en segundos
         self.color_original = color  # Color base para restaurar después de efectos
 
+    def reset(self, x: float, y: float, color: Tuple[int, int, int], radio: int = 20) -> None:
+        """
+        Reinicializa el enemigo en el sitio para reutilizarlo tras ser eliminado.
+
+        Parameters
+        ----------
+        x : float
+            Nueva posición horizontal del enemigo
+        y : float
+            Nueva posición vertical del enemigo
+        color : Tuple[int, int, int]
+            Color RGB del enemigo
+        radio : int, optional
+            Radio del enemigo en píxeles (por defecto 20)
+
+        Raises
+        ------
+        TypeError
+            Si color no es una tupla RGB
+        ValueError
+            Si el radio no es un valor positivo
+
+        Notes
+        -----
+        Deja al enemigo en el mismo estado que uno recién construido (vida
+        completa, sin invulnerabilidad y activo), conservando su objetivo.
+        """
+        # Reutilización desde el pool: solo se valida sin `python -O`
+        if __debug__:
+            if not isinstance(color, tuple) or len(color) != 3:
+                raise TypeError("color debe ser una tupla RGB de 3 elementos")
+            if radio <= 0:
+                raise ValueError("El radio debe ser un valor positivo")
+
+        self.posicion = Vector2D(x, y)
+        self.color = color
+        self.color_original = color
+        self.radio = int(radio)
+        self.vida = self.vida_maxima
+        self.tiempo_invulnerable = 0.0
+        self.activo = True
+
     def establecer_objetivo(self, objetivo: 'Jugador') -> None:
         """
         Establece el objetivo que el enemigo debe perseguir.
@@ -141,8 +183,10 @@ class Enemigo(Figura):
         -----
         Durante la invulnerabilidad, el enemigo parpadea para indicar el estado.
         """
-        if dt <= 0:
-            raise ValueError("dt debe ser un valor positivo")
+        # Se llama en cada frame: solo se valida sin `python -O`
+        if __debug__:
+            if dt <= 0:
+                raise ValueError("dt debe ser un valor positivo")
 
         # Solo procesar si el enemigo está activo
         if not self.activo:
@@ -208,14 +252,28 @@ class Enemigo(Figura):
         if self.objetivo and self.objetivo.activo:
             # Calcular dirección hacia el objetivo
             direccion = self.objetivo.posicion - self.posicion
-            magnitud = direccion.magnitud()
 
             # Solo mover si el objetivo está a una distancia significativa
-            if magnitud > 0:
+            # (normalizar ya calcula la raíz; aquí basta el cuadrado)
+            if direccion.magnitud_cuadrada() > 0:
                 direccion_normalizada = direccion.normalizar()
                 movimiento = direccion_normalizada * (self.velocidad * dt)
                 self.posicion = self.posicion + movimiento
 
+    def _sprite(self) -> Tuple[pygame.Surface, int]:
+        """
+        Obtiene el sprite del avión enemigo con su color actual.
+
+        Returns
+        -------
+        Tuple[pygame.Surface, int]
+            Sprite cuadrado con el avión centrado y la mitad de su lado
+        """
+        radio = self.radio
+        # Avión enemigo (apunta hacia abajo)
+        return self._obtener_sprite(('enemigo', self.color, radio), radio + 2,
+                                    self._dibujar_avion_enemigo)
+
     def recibir_dano(self) -> bool:
         """
         Aplica daño al enemigo, activando invulnerabilidad temporal.
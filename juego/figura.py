@@ -1,5 +1,5 @@
 import pygame
-from typing import Tuple
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
 from .vector2d import Vector2D
 
 class Figura:
@@ -29,6 +29,11 @@ class Figura:
     >>> figura.pintar()  # Dibuja un círculo rojo en (100, 100)
     """
 
+    # Sprites pre-renderizados, compartidos por todas las figuras:
+    # clave de aspecto -> superficie con la figura centrada
+    _cache_sprites: Dict[Hashable, pygame.Surface] = {}
+    _max_cache_sprites = 2048  # Aviones, misiles y monedas caben holgadamente
+
     def __init__(self, pantalla: pygame.Surface, x: float, y: float, 
                  color: Tuple[int, int, int], radio: int = 20):
         """
@@ -58,6 +63,8 @@ class Figura:
             raise TypeError("color debe ser una tupla RGB de 3 elementos")
         
         self.pantalla = pantalla
+        # La pantalla no cambia de tamaño durante una partida
+        self._ancho_pantalla, self._alto_pantalla = pantalla.get_size()
         self.posicion = Vector2D(x, y)
         self.color = color
         self.radio = int(radio)
@@ -87,90 +94,232 @@ class Figura:
         """
         return self.posicion.y
 
-    def pintar(self) -> None:
+    def pintar(self, rects: Optional[List[pygame.Rect]] = None) -> None:
         """
         Dibuja la figura en la pantalla si está activa.
 
         Dibuja un avión realista usando múltiples formas geométricas.
         Solo se dibuja si la figura está marcada como activa.
 
+        Parameters
+        ----------
+        rects : List[pygame.Rect], optional
+            Si se indica, se le añade el rectángulo de pantalla que se dibujó
+
         Notes
         -----
         Las coordenadas se convierten a enteros para compatibilidad con pygame.
+        Las figuras que quedan completamente fuera de la pantalla no se dibujan.
         """
         if self.activo:
-            x = int(self.posicion.x)
-            y = int(self.posicion.y)
-            radio = self.radio
-            
-            # Determinar si es enemigo o jugador
-            es_enemigo = hasattr(self, 'objetivo')
-            
-            if es_enemigo:
-                # Avión enemigo (apunta hacia abajo)
-                self._dibujar_avion_enemigo(x, y, radio)
-            else:
-                # Avión jugador (apunta hacia arriba)
-                self._dibujar_avion_jugador(x, y, radio)
+            x = self.posicion.x
+            y = self.posicion.y
+            r = self.radio
+            if (x + r < 0 or x - r > self._ancho_pantalla or
+                    y + r < 0 or y - r > self._alto_pantalla):
+                return
+            sprite, mitad = self._sprite()
+            rect = self.pantalla.blit(sprite, (int(x) - mitad, int(y) - mitad))
+            if rects is not None:
+                rects.append(rect)
+
+    @staticmethod
+    def pintar_muchos(pantalla: pygame.Surface, figuras: Iterable['Figura'],
+                      rects: Optional[List[pygame.Rect]] = None) -> None:
+        """
+        Dibuja varias figuras con una sola llamada de blit por lotes.
+
+        Parameters
+        ----------
+        pantalla : pygame.Surface
+            Superficie donde se dibujan las figuras
+        figuras : Iterable[Figura]
+            Figuras a dibujar; las inactivas se omiten
+        rects : List[pygame.Rect], optional
+            Si se indica, se le añaden los rectángulos de pantalla dibujados
+
+        Notes
+        -----
+        Equivale a llamar a `pintar` en cada figura, pero reúne los sprites en
+        una lista y la envía de una vez con `Surface.fblits` (o `Surface.blits`
+        si la versión de pygame no la tiene), evitando una llamada a C por
+        figura. Las figuras se dibujan en el orden recibido y las que quedan
+        completamente fuera de la pantalla se descartan antes de buscar su
+        sprite.
+        """
+        lote = []
+        for figura in figuras:
+            if figura.activo:
+                x = figura.posicion.x
+                y = figura.posicion.y
+                r = figura.radio
+                if (x + r < 0 or x - r > figura._ancho_pantalla or
+                        y + r < 0 or y - r > figura._alto_pantalla):
+                    continue
+                sprite, mitad = figura._sprite()
+                lote.append((sprite, (int(x) - mitad, int(y) - mitad)))
+        if not lote:
+            return
+        if rects is not None:
+            # Quien pide los rectángulos los usa para actualizar solo esas zonas
+            rects.extend(pantalla.blits(lote))
+            return
+        fblits = getattr(pantalla, 'fblits', None)
+        if fblits is not None:
+            fblits(lote)
+        else:
+            pantalla.blits(lote, doreturn=False)
+
+    def _sprite(self) -> Tuple[pygame.Surface, int]:
+        """
+        Obtiene el sprite que representa el aspecto actual de la figura.
+
+        Returns
+        -------
+        Tuple[pygame.Surface, int]
+            Sprite cuadrado con la figura centrada y la mitad de su lado
+
+        Notes
+        -----
+        Por defecto la figura es el avión del jugador; las subclases con otro
+        aspecto (enemigos, proyectiles) sobrescriben este método.
+        """
+        radio = self.radio
+        # Avión jugador (apunta hacia arriba)
+        return self._obtener_sprite(('jugador', self.color, radio), radio + 2,
+                                    self._dibujar_avion_jugador)
+
+    def _obtener_sprite(self, clave: Hashable, mitad: int,
+                        dibujar: Callable[..., None], *extra: Any
+                        ) -> Tuple[pygame.Surface, int]:
+        """
+        Devuelve el sprite pre-renderizado de una clave, creándolo si no existe.
+
+        Parameters
+        ----------
+        clave : Hashable
+            Identifica el aspecto de la figura (tipo, color, radio, ...). Dos
+            figuras con la misma clave deben dibujarse igual.
+        mitad : int
+            Mitad del lado del sprite cuadrado; debe abarcar todo el dibujo
+        dibujar : Callable[..., None]
+            Función que dibuja la figura con primitivas, llamada como
+            ``dibujar(superficie, x, y, radio, *extra)``
+        *extra : Any
+            Argumentos adicionales para `dibujar`
+
+        Returns
+        -------
+        Tuple[pygame.Surface, int]
+            Sprite y la mitad de su lado (para centrarlo en la posición)
+
+        Notes
+        -----
+        La primera vez que aparece una clave, `dibujar` se ejecuta sobre una
+        superficie transparente y el resultado se guarda. Las siguientes
+        veces basta con un blit en lugar de varias llamadas a pygame.draw.
+        El sprite se guarda convertido al formato de píxeles de `pantalla`.
+        El dibujo es idéntico porque las primitivas solo dependen de la
+        posición a través de desplazamientos enteros respecto al centro.
+        """
+        sprite = Figura._cache_sprites.get(clave)
+        if sprite is None:
+            if len(Figura._cache_sprites) >= Figura._max_cache_sprites:
+                Figura._cache_sprites.clear()
+            sprite = pygame.Surface((2 * mitad, 2 * mitad), pygame.SRCALPHA)
+            dibujar(sprite, mitad, mitad, self.radio, *extra)
+            # En el formato de la pantalla el blit no convierte cada píxel
+            sprite = sprite.convert_alpha(self.pantalla)
+            Figura._cache_sprites[clave] = sprite
+        return sprite, mitad
     
-    def _dibujar_avion_jugador(self, x: int, y: int, radio: int) -> None:
+    @staticmethod
+    def _oscurecer(color: Tuple[int, int, int], cantidad: int) -> Tuple[int, int, int]:
+        """
+        Devuelve un color más oscuro restando la misma cantidad a cada canal.
+
+        Parameters
+        ----------
+        color : Tuple[int, int, int]
+            Color RGB de partida
+        cantidad : int
+            Valor que se resta a cada canal (sin bajar de 0)
+
+        Returns
+        -------
+        Tuple[int, int, int]
+            Color RGB oscurecido
+
+        Examples
+        --------
+        >>> Figura._oscurecer((200, 100, 50), 80)
+        (120, 20, 0)
+        """
+        r, g, b = color
+        return (r - cantidad if r > cantidad else 0,
+                g - cantidad if g > cantidad else 0,
+                b - cantidad if b > cantidad else 0)
+
+    def _dibujar_avion_jugador(self, superficie: pygame.Surface, x: int, y: int,
+                               radio: int) -> None:
         """Dibuja un avión del jugador realista apuntando hacia arriba."""
         # Color principal y secundario
         color_principal = self.color
-        color_secundario = tuple(max(0, c - 80) for c in self.color)
-        color_detalle = tuple(max(0, c - 120) for c in self.color)
+        color_secundario = self._oscurecer(self.color, 80)
+        color_detalle = self._oscurecer(self.color, 120)
         
         # Fuselaje principal (cuerpo del avión)
-        pygame.draw.ellipse(self.pantalla, color_principal, 
+        pygame.draw.ellipse(superficie, color_principal, 
                            (x - radio//3, y - radio//2, radio*2//3, radio))
         
         # Ala principal (horizontal)
-        pygame.draw.ellipse(self.pantalla, color_principal,
+        pygame.draw.ellipse(superficie, color_principal,
                            (x - radio//2, y - radio//6, radio, radio//3))
         
         # Ala trasera (más pequeña)
-        pygame.draw.ellipse(self.pantalla, color_secundario,
+        pygame.draw.ellipse(superficie, color_secundario,
                            (x - radio//3, y + radio//4, radio*2//3, radio//4))
         
         # Cabina (círculo pequeño)
-        pygame.draw.circle(self.pantalla, color_secundario, (x, y - radio//4), radio//4)
+        pygame.draw.circle(superficie, color_secundario, (x, y - radio//4), radio//4)
         
         # Motor/escape (rectángulo pequeño)
-        pygame.draw.rect(self.pantalla, color_detalle,
+        pygame.draw.rect(superficie, color_detalle,
                         (x - radio//6, y + radio//3, radio//3, radio//6))
         
         # Detalles de las alas
-        pygame.draw.line(self.pantalla, color_detalle, 
+        pygame.draw.line(superficie, color_detalle, 
                         (x - radio//2, y), (x + radio//2, y), 2)
     
-    def _dibujar_avion_enemigo(self, x: int, y: int, radio: int) -> None:
+    def _dibujar_avion_enemigo(self, superficie: pygame.Surface, x: int, y: int,
+                               radio: int) -> None:
         """Dibuja un avión enemigo realista apuntando hacia abajo."""
         # Color principal y secundario
         color_principal = self.color
-        color_secundario = tuple(max(0, c - 80) for c in self.color)
-        color_detalle = tuple(max(0, c - 120) for c in self.color)
+        color_secundario = self._oscurecer(self.color, 80)
+        color_detalle = self._oscurecer(self.color, 120)
         
         # Fuselaje principal (cuerpo del avión)
-        pygame.draw.ellipse(self.pantalla, color_principal, 
+        pygame.draw.ellipse(superficie, color_principal, 
                            (x - radio//3, y - radio//2, radio*2//3, radio))
         
         # Ala principal (horizontal)
-        pygame.draw.ellipse(self.pantalla, color_principal,
+        pygame.draw.ellipse(superficie, color_principal,
                            (x - radio//2, y - radio//6, radio, radio//3))
         
         # Ala trasera (más pequeña)
-        pygame.draw.ellipse(self.pantalla, color_secundario,
+        pygame.draw.ellipse(superficie, color_secundario,
                            (x - radio//3, y - radio//4, radio*2//3, radio//4))
         
         # Cabina (círculo pequeño)
-        pygame.draw.circle(self.pantalla, color_secundario, (x, y + radio//4), radio//4)
+        pygame.draw.circle(superficie, color_secundario, (x, y + radio//4), radio//4)
         
         # Motor/escape (rectángulo pequeño)
-        pygame.draw.rect(self.pantalla, color_detalle,
+        pygame.draw.rect(superficie, color_detalle,
                         (x - radio//6, y - radio//3, radio//3, radio//6))
         
         # Detalles de las alas
-        pygame.draw.line(self.pantalla, color_detalle, 
+        pygame.draw.line(superficie, color_detalle, 
                         (x - radio//2, y), (x + radio//2, y), 2)
 
     def colision(self, otro: 'Figura') -> bool:
@@ -202,8 +351,12 @@ class Figura:
         if not (self.activo and otro.activo):
             return False
         
-        distancia = (self.posicion - otro.posicion).magnitud()
-        return distancia <= (self.radio + otro.radio)
+        # Distancia al cuadrado frente a la suma de radios al cuadrado: evita
+        # la raíz cuadrada y el Vector2D temporal de la resta
+        dx = self.posicion.x - otro.posicion.x
+        dy = self.posicion.y - otro.posicion.y
+        suma_radios = self.radio + otro.radio
+        return dx * dx + dy * dy <= suma_radios * suma_radios
 
     def mantener_en_pantalla(self) -> None:
         """
@@ -215,17 +368,23 @@ class Figura:
         Notes
         -----
         Considera el radio de la figura para que no se corte en los bordes.
+        Usa el tamaño de pantalla guardado al crear la figura y solo escribe
+        la posición cuando hay que corregirla, que es el caso poco frecuente.
         """
-        ancho_pantalla = self.pantalla.get_width()
-        alto_pantalla = self.pantalla.get_height()
+        r = self.radio
+        posicion = self.posicion
 
         # Ajustar posición horizontal
-        self.posicion.x = max(self.radio, self.posicion.x)
-        self.posicion.x = min(ancho_pantalla - self.radio, self.posicion.x)
-        
+        if posicion.x < r:
+            posicion.x = r
+        if posicion.x > self._ancho_pantalla - r:
+            posicion.x = self._ancho_pantalla - r
+
         # Ajustar posición vertical
-        self.posicion.y = max(self.radio, self.posicion.y)
-        self.posicion.y = min(alto_pantalla - self.radio, self.posicion.y)
+        if posicion.y < r:
+            posicion.y = r
+        if posicion.y > self._alto_pantalla - r:
+            posicion.y = self._alto_pantalla - r
 
     def actualizar(self) -> None:
         """
@@ -1,4 +1,4 @@
-from typing import List, Tuple, Dict
+from typing import List, Optional, Tuple, Dict
 import pygame
 
 from .vector2d import Vector2D
@@ -76,6 +76,7 @@ class Jugador(Figura):
         self.ultimo_disparo = 0.0  # Tiempo desde el último disparo
         self.cooldown_disparo = 0.3  # segundos entre disparos
         self.proyectiles: List[Proyectil] = []  # Lista de proyectiles activos
+        self._pool_proyectiles: List[Proyectil] = []  # Proyectiles inactivos para reutilizar
         
         # Sistema de mejoras para misiles
         self.mejoras = {
@@ -158,13 +159,33 @@ class Jugador(Figura):
 
         Notes
         -----
-        Se usa una copia de la lista para evitar problemas al modificar durante la iteración.
+        Los proyectiles inactivos se devuelven al pool para reutilizarlos en
+        el próximo disparo. Todos se actualizan en un solo recorrido con
+        `Proyectil.actualizar_muchos`.
         """
-        # Crear copia de la lista para iterar de forma segura
-        for proyectil in self.proyectiles[:]:
-            proyectil.actualizar(dt)
-            if not proyectil.activo:
-                self.proyectiles.remove(proyectil)
+        Proyectil.actualizar_muchos(self.proyectiles, dt)
+        self.liberar_proyectiles_inactivos()
+
+    def liberar_proyectiles_inactivos(self) -> None:
+        """
+        Retira los proyectiles inactivos de la lista y los guarda para reutilizarlos.
+
+        Notes
+        -----
+        La lista se compacta en el sitio, conservando el orden de los proyectiles
+        activos. Los retirados pasan al pool que usa `disparar`, evitando crear
+        un objeto nuevo en cada disparo.
+        """
+        proyectiles = self.proyectiles
+        escritura = 0
+        for lectura in range(len(proyectiles)):
+            proyectil = proyectiles[lectura]
+            if proyectil.activo:
+                proyectiles[escritura] = proyectil
+                escritura += 1
+            else:
+                self._pool_proyectiles.append(proyectil)
+        del proyectiles[escritura:]
 
     def disparar(self, objetivo_pos: Tuple[float, float]) -> bool:
         """
@@ -209,7 +230,12 @@ class Jugador(Figura):
         # Crear y almacenar nuevo proyectil con mejoras aplicadas
         velocidad_base = 300
         velocidad_mejorada = velocidad_base * self.mejoras['velocidad_misil']
-        proyectil = Proyectil(self.pantalla, self.posicion.x, self.posicion.y, direccion, velocidad_mejorada)
+        # (se reutiliza un proyectil del pool si hay alguno disponible)
+        if self._pool_proyectiles:
+            proyectil = self._pool_proyectiles.pop()
+            proyectil.reset(self.posicion.x, self.posicion.y, direccion, velocidad_mejorada)
+        else:
+            proyectil = Proyectil(self.pantalla, self.posicion.x, self.posicion.y, direccion, velocidad_mejorada)
         self.proyectiles.append(proyectil)
 
         # Reiniciar temporizador de disparo
@@ -217,12 +243,17 @@ class Jugador(Figura):
 
         return True
 
-    def pintar(self) -> None:
+    def pintar(self, rects: Optional[List[pygame.Rect]] = None) -> None:
         """
         Dibuja al jugador y todos sus proyectiles activos en la pantalla.
 
         Override del método pintar de la clase base para incluir los proyectiles.
 
+        Parameters
+        ----------
+        rects : List[pygame.Rect], optional
+            Si se indica, se le añaden los rectángulos de pantalla dibujados
+
         Notes
         -----
         Primero se dibujan los proyectiles y luego el jugador para mantener
@@ -231,12 +262,12 @@ class Jugador(Figura):
         if not self.activo:
             return
 
-        # Pintar proyectiles primero (para que queden detrás del jugador si hay superposición)
-        for proyectil in self.proyectiles:
-            proyectil.pintar()
+        # Pintar proyectiles primero (para que queden detrás del jugador si hay
+        # superposición), todos en un solo lote
+        Figura.pintar_muchos(self.pantalla, self.proyectiles, rects)
 
         # Luego pintar al jugador
-        super().pintar()
+        super().pintar(rects)
 
     def obtener_estado_disparo(self) -> Tuple[bool, float]:
         """
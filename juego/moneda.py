@@ -1,275 +1,438 @@
-from typing import Tuple, Dict, Any
-import pygame
-import math
-import random
-
-from .vector2d import Vector2D
-from .figura import Figura
-
-
-class Moneda(Figura):
-    """
-    Representa una moneda que aparece como recompensa cuando se elimina un enemigo.
-
-    Hereda de la clase Figura y añade funcionalidades específicas para monedas:
-    animación de rotación, efecto de brillo y valor de recompensa.
-
-    Attributes
-    ----------
-    tipo_mejora : str
-        Tipo de mejora que otorga la moneda ('velocidad', 'daño', 'rapidez_disparo', 'puntos')
-    valor_mejora : int
-        Valor de la mejora que otorga la moneda
-    tiempo_vida : float
-        Tiempo de vida restante de la moneda en segundos
-    tiempo_vida_maximo : float
-        Tiempo máximo de vida de la moneda en segundos
-    angulo_rotacion : float
-        Ángulo actual de rotación para el efecto visual
-    velocidad_rotacion : float
-        Velocidad de rotación en radianes por segundo
-
-    Inherited Attributes
-    --------------------
-    pantalla : pygame.Surface
-        Superficie donde se dibuja la moneda
-    posicion : Vector2D
-        Posición actual de la moneda
-    color : Tuple[int, int, int]
-        Color de la moneda (dorado por defecto)
-    radio : int
-        Radio de la moneda (15 píxeles por defecto)
-    activo : bool
-        Estado de actividad de la moneda
-
-    Examples
-    --------
-    >>> pantalla = pygame.display.set_mode((800, 600))
-    >>> moneda = Moneda(pantalla, 400, 300, 5)  # Moneda de 5 puntos
-    >>> moneda.actualizar(0.016)  # Actualizar para 16ms
-    >>> moneda.pintar()  # Dibujar la moneda con animación
-    """
-
-    def __init__(self, pantalla: pygame.Surface, x: float, y: float, 
-                 tipo_mejora: str = None, valor_mejora: int = 1):
-        """
-        Inicializa una nueva moneda con tipo de mejora específico.
-
-        Parameters
-        ----------
-        pantalla : pygame.Surface
-            Superficie de pygame donde se renderizará la moneda
-        x : float
-            Posición horizontal inicial de la moneda
-        y : float
-            Posición vertical inicial de la moneda
-        tipo_mejora : str, optional
-            Tipo de mejora ('velocidad', 'daño', 'rapidez_disparo', 'puntos')
-            Si es None, se selecciona aleatoriamente
-        valor_mejora : int, optional
-            Valor de la mejora que otorga la moneda (por defecto 1)
-
-        Raises
-        ------
-        TypeError
-            Si los tipos de los parámetros no son los esperados
-        ValueError
-            Si el valor no es un número positivo o el tipo no es válido
-
-        Notes
-        -----
-        La moneda cambia de color según el tipo de mejora.
-        """
-        if not isinstance(valor_mejora, int) or valor_mejora <= 0:
-            raise ValueError("El valor debe ser un número entero positivo")
-
-        # Tipos de mejoras disponibles
-        tipos_disponibles = ['velocidad', 'daño', 'rapidez_disparo', 'puntos']
-        
-        # Seleccionar tipo aleatorio si no se especifica
-        if tipo_mejora is None:
-            tipo_mejora = random.choice(tipos_disponibles)
-        elif tipo_mejora not in tipos_disponibles:
-            raise ValueError(f"Tipo de mejora inválido. Debe ser uno de: {tipos_disponibles}")
-
-        # Colores según el tipo de mejora
-        colores_mejoras = {
-            'velocidad': (0, 255, 0),      # Verde
-            'daño': (255, 0, 0),           # Rojo
-            'rapidez_disparo': (0, 0, 255), # Azul
-            'puntos': (255, 215, 0)        # Dorado
-        }
-        
-        color = colores_mejoras[tipo_mejora]
-        
-        super().__init__(pantalla, x, y, color, 15)
-        
-        self.tipo_mejora = tipo_mejora
-        self.valor_mejora = valor_mejora
-        self.tiempo_vida_maximo = 10.0  # 10 segundos de vida
-        self.tiempo_vida = self.tiempo_vida_maximo
-        self.angulo_rotacion = 0.0
-        self.velocidad_rotacion = 3.0  # radianes por segundo
-
-    def actualizar(self, dt: float) -> None:
-        """
-        Actualiza el estado de la moneda en cada frame del juego.
-
-        Realiza las siguientes operaciones:
-        1. Actualiza la rotación para el efecto visual
-        2. Reduce el tiempo de vida
-        3. Desactiva la moneda si se agota su tiempo de vida
-
-        Parameters
-        ----------
-        dt : float
-            Tiempo transcurrido desde la última actualización en segundos
-
-        Raises
-        ------
-        ValueError
-            Si dt no es un valor positivo
-        """
-        if dt <= 0:
-            raise ValueError("dt debe ser un valor positivo")
-
-        if not self.activo:
-            return
-
-        # 1. Actualizar rotación
-        self.angulo_rotacion += self.velocidad_rotacion * dt
-        
-        # 2. Reducir tiempo de vida
-        self.tiempo_vida -= dt
-        
-        # 3. Desactivar si se agota el tiempo
-        if self.tiempo_vida <= 0:
-            self.activo = False
-
-    def pintar(self) -> None:
-        """
-        Dibuja la moneda con efecto de rotación y brillo.
-
-        Override del método pintar de la clase base para crear un efecto visual
-        atractivo que incluye rotación y un efecto de brillo basado en el tiempo de vida.
-
-        Notes
-        -----
-        La moneda se dibuja como un círculo dorado con un efecto de brillo interno
-        que cambia según el ángulo de rotación y el tiempo de vida restante.
-        """
-        if not self.activo:
-            return
-
-        x = int(self.posicion.x)
-        y = int(self.posicion.y)
-        radio = self.radio
-
-        # Calcular intensidad del brillo basado en el tiempo de vida
-        intensidad_brillo = self.tiempo_vida / self.tiempo_vida_maximo
-        
-        # Color base más intenso según el valor
-        if self.valor_mejora >= 5:
-            color_base = (255, 255, 0)  # Amarillo brillante para monedas de alto valor
-        elif self.valor_mejora >= 3:
-            color_base = (255, 215, 0)  # Dorado estándar
-        else:
-            color_base = (255, 200, 0)  # Dorado más tenue
-
-        # Dibujar el círculo principal de la moneda
-        pygame.draw.circle(self.pantalla, color_base, (x, y), radio)
-        
-        # Dibujar borde de la moneda
-        pygame.draw.circle(self.pantalla, (200, 150, 0), (x, y), radio, 2)
-
-        # Efecto de brillo rotatorio
-        brillo_x = x + int(math.cos(self.angulo_rotacion) * radio * 0.4)
-        brillo_y = y + int(math.sin(self.angulo_rotacion) * radio * 0.4)
-        brillo_radio = max(3, int(radio * 0.3 * intensidad_brillo))
-        
-        # Color del brillo (blanco semi-transparente)
-        color_brillo = (255, 255, 255)
-        pygame.draw.circle(self.pantalla, color_brillo, (brillo_x, brillo_y), brillo_radio)
-
-        # Efecto de destello adicional
-        destello_x = x + int(math.cos(self.angulo_rotacion + math.pi) * radio * 0.2)
-        destello_y = y + int(math.sin(self.angulo_rotacion + math.pi) * radio * 0.2)
-        destello_radio = max(1, int(radio * 0.15 * intensidad_brillo))
-        
-        pygame.draw.circle(self.pantalla, color_brillo, (destello_x, destello_y), destello_radio)
-
-        # Mostrar el símbolo de la mejora
-        simbolos_mejoras = {
-            'velocidad': 'V',
-            'daño': 'D', 
-            'rapidez_disparo': 'R',
-            'puntos': 'P'
-        }
-        
-        simbolo = simbolos_mejoras.get(self.tipo_mejora, '?')
-        fuente = pygame.font.Font(None, 16)
-        texto_mejora = fuente.render(simbolo, True, (0, 0, 0))
-        texto_rect = texto_mejora.get_rect(center=(x, y))
-        self.pantalla.blit(texto_mejora, texto_rect)
-
-    def recolectar(self) -> Dict[str, Any]:
-        """
-        Marca la moneda como recolectada y retorna información sobre la mejora.
-
-        Returns
-        -------
-        Dict[str, Any]
-            Diccionario con información de la mejora:
-            - 'tipo': tipo de mejora
-            - 'valor': valor de la mejora
-            - 'puntos': puntos adicionales (solo para tipo 'puntos')
-
-        Examples
-        --------
-        >>> mejora = moneda.recolectar()
-        >>> print(f"¡Mejora de {mejora['tipo']} +{mejora['valor']}!")
-        """
-        self.activo = False
-        return {
-            'tipo': self.tipo_mejora,
-            'valor': self.valor_mejora,
-            'puntos': self.valor_mejora if self.tipo_mejora == 'puntos' else 0
-        }
-
-    def obtener_tiempo_vida_restante(self) -> float:
-        """
-        Obtiene el tiempo de vida restante de la moneda.
-
-        Returns
-        -------
-        float
-            Tiempo restante en segundos antes de que la moneda desaparezca
-        """
-        return max(0.0, self.tiempo_vida)
-
-    def __repr__(self) -> str:
-        """
-        Representación oficial de la moneda para depuración.
-
-        Returns
-        -------
-        str
-            Cadena que representa el estado actual de la moneda
-        """
-        estado = "activa" if self.activo else "inactiva"
-        tiempo_restante = self.obtener_tiempo_vida_restante()
-        
-        return (f"Moneda(pos=({self.x:.1f}, {self.y:.1f}), "
-                f"tipo={self.tipo_mejora}, valor={self.valor_mejora}, "
-                f"tiempo={tiempo_restante:.1f}s, {estado})")
-
-    def __str__(self) -> str:
-        """
-        Representación legible de la moneda para usuarios.
-
-        Returns
-        -------
-        str
-            Descripción simplificada de la moneda
-        """
-        return f"Moneda de {self.tipo_mejora} (+{self.valor_mejora}) en ({int(self.x)}, {int(self.y)})"
+from typing import Tuple, Dict, Any, List, Optional
+import pygame
+import math
+import random
+
+from .vector2d import Vector2D
+from .figura import Figura
+
+
+class Moneda(Figura):
+    """
+    Representa una moneda que aparece como recompensa cuando se elimina un enemigo.
+
+    Hereda de la clase Figura y añade funcionalidades específicas para monedas:
+    animación de rotación, efecto de brillo y valor de recompensa.
+
+    Attributes
+    ----------
+    tipo_mejora : str
+        Tipo de mejora que otorga la moneda ('velocidad', 'daño', 'rapidez_disparo', 'puntos')
+    valor_mejora : int
+        Valor de la mejora que otorga la moneda
+    tiempo_vida : float
+        Tiempo de vida restante de la moneda en segundos (derivado del reloj)
+    tiempo_vida_maximo : float
+        Tiempo máximo de vida de la moneda en segundos
+    angulo_rotacion : float
+        Ángulo actual de rotación para el efecto visual (derivado del reloj)
+    velocidad_rotacion : float
+        Velocidad de rotación en radianes por segundo
+
+    Inherited Attributes
+    --------------------
+    pantalla : pygame.Surface
+        Superficie donde se dibuja la moneda
+    posicion : Vector2D
+        Posición actual de la moneda
+    color : Tuple[int, int, int]
+        Color de la moneda (dorado por defecto)
+    radio : int
+        Radio de la moneda (15 píxeles por defecto)
+    activo : bool
+        Estado de actividad de la moneda
+
+    Examples
+    --------
+    >>> pantalla = pygame.display.set_mode((800, 600))
+    >>> moneda = Moneda(pantalla, 400, 300, 5)  # Moneda de 5 puntos
+    >>> moneda.actualizar(0.016)  # Reloj del juego 16ms después de aparecer
+    >>> moneda.pintar()  # Dibujar la moneda con animación
+    """
+
+    # Tipos de mejoras disponibles
+    TIPOS_MEJORA = ('velocidad', 'daño', 'rapidez_disparo', 'puntos')
+
+    # Símbolo que se muestra en la moneda según la mejora
+    _SIMBOLOS_MEJORAS = {
+        'velocidad': 'V',
+        'daño': 'D', 
+        'rapidez_disparo': 'R',
+        'puntos': 'P'
+    }
+    # Colores según el tipo de mejora
+    _COLORES_MEJORAS = {
+        'velocidad': (0, 255, 0),      # Verde
+        'daño': (255, 0, 0),           # Rojo
+        'rapidez_disparo': (0, 0, 255), # Azul
+        'puntos': (255, 215, 0)        # Dorado
+    }
+    # Fuente y símbolos renderizados, compartidos por todas las monedas
+    # (se crean la primera vez que se dibuja una moneda)
+    _fuente: Optional[pygame.font.Font] = None
+    _simbolos_render: Dict[str, pygame.Surface] = {}
+
+    # Tabla de (coseno, seno) para el giro del brillo: 256 pasos por vuelta
+    _TABLA_GIRO = tuple((math.cos(i * math.tau / 256), math.sin(i * math.tau / 256))
+                        for i in range(256))
+    _PASOS_POR_RADIAN = 256 / math.tau
+
+    def __init__(self, pantalla: pygame.Surface, x: float, y: float, 
+                 tipo_mejora: str = None, valor_mejora: int = 1, instante: float = 0.0):
+        """
+        Inicializa una nueva moneda con tipo de mejora específico.
+
+        Parameters
+        ----------
+        pantalla : pygame.Surface
+            Superficie de pygame donde se renderizará la moneda
+        x : float
+            Posición horizontal inicial de la moneda
+        y : float
+            Posición vertical inicial de la moneda
+        tipo_mejora : str, optional
+            Tipo de mejora ('velocidad', 'daño', 'rapidez_disparo', 'puntos')
+            Si es None, se selecciona aleatoriamente
+        valor_mejora : int, optional
+            Valor de la mejora que otorga la moneda (por defecto 1)
+        instante : float, optional
+            Tiempo de juego en segundos en el que aparece la moneda (por defecto 0)
+
+        Raises
+        ------
+        TypeError
+            Si los tipos de los parámetros no son los esperados
+        ValueError
+            Si el valor no es un número positivo o el tipo no es válido
+
+        Notes
+        -----
+        La moneda cambia de color según el tipo de mejora.
+        """
+        if not isinstance(valor_mejora, int) or valor_mejora <= 0:
+            raise ValueError("El valor debe ser un número entero positivo")
+
+        tipos_disponibles = list(self.TIPOS_MEJORA)
+        
+        # Seleccionar tipo aleatorio si no se especifica
+        if tipo_mejora is None:
+            tipo_mejora = random.choice(tipos_disponibles)
+        elif tipo_mejora not in tipos_disponibles:
+            raise ValueError(f"Tipo de mejora inválido. Debe ser uno de: {tipos_disponibles}")
+
+        color = self._COLORES_MEJORAS[tipo_mejora]
+        
+        super().__init__(pantalla, x, y, color, 15)
+        
+        self.tipo_mejora = tipo_mejora
+        self.valor_mejora = valor_mejora
+        self.tiempo_vida_maximo = 10.0  # 10 segundos de vida
+        self.velocidad_rotacion = 3.0  # radianes por segundo
+        # La vida y el giro se derivan del reloj del juego, sin acumular por frame
+        self._t_aparicion = instante  # Instante de aparición
+        self._t_expira = instante + self.tiempo_vida_maximo  # Instante de caducidad
+        self._ahora = instante  # Último instante recibido en actualizar()
+        self._precalcular_dibujo()
+
+    def reset(self, x: float, y: float, tipo_mejora: str, valor_mejora: int = 1,
+              instante: float = 0.0) -> None:
+        """
+        Reinicializa la moneda en el sitio para reutilizarla tras desaparecer.
+
+        Parameters
+        ----------
+        x : float
+            Nueva posición horizontal de la moneda
+        y : float
+            Nueva posición vertical de la moneda
+        tipo_mejora : str
+            Tipo de mejora ('velocidad', 'daño', 'rapidez_disparo', 'puntos')
+        valor_mejora : int, optional
+            Valor de la mejora que otorga la moneda (por defecto 1)
+        instante : float, optional
+            Tiempo de juego en segundos en el que aparece la moneda (por defecto 0)
+
+        Raises
+        ------
+        ValueError
+            Si el valor no es un número positivo o el tipo no es válido
+
+        Notes
+        -----
+        Deja a la moneda en el mismo estado que una recién construida.
+        """
+        # Reutilización desde el pool: solo se valida sin `python -O`
+        if __debug__:
+            if not isinstance(valor_mejora, int) or valor_mejora <= 0:
+                raise ValueError("El valor debe ser un número entero positivo")
+            if tipo_mejora not in self._COLORES_MEJORAS:
+                raise ValueError(f"Tipo de mejora inválido. Debe ser uno de: {list(self.TIPOS_MEJORA)}")
+
+        self.posicion = Vector2D(x, y)
+        self.color = self._COLORES_MEJORAS[tipo_mejora]
+        self.tipo_mejora = tipo_mejora
+        self.valor_mejora = valor_mejora
+        self._t_aparicion = instante
+        self._t_expira = instante + self.tiempo_vida_maximo
+        self._ahora = instante
+        self.activo = True
+        self._precalcular_dibujo()
+
+    @property
+    def tiempo_vida(self) -> float:
+        """
+        Obtiene el tiempo de vida restante según el último instante conocido.
+
+        Returns
+        -------
+        float
+            Segundos que faltan para que caduque la moneda (negativo si ya caducó)
+        """
+        return self._t_expira - self._ahora
+
+    @tiempo_vida.setter
+    def tiempo_vida(self, valor: float) -> None:
+        self._t_expira = self._ahora + valor
+
+    @property
+    def angulo_rotacion(self) -> float:
+        """
+        Obtiene el ángulo de rotación actual del efecto de brillo.
+
+        Returns
+        -------
+        float
+            Ángulo en radianes desde la aparición de la moneda
+        """
+        return (self._ahora - self._t_aparicion) * self.velocidad_rotacion
+
+    def _precalcular_dibujo(self) -> None:
+        """
+        Calcula los valores de dibujo que no cambian durante la vida de la moneda.
+
+        Notes
+        -----
+        El color base depende solo del valor de la mejora y las distancias y
+        escalas de los brillos solo del radio, así que `pintar` no tiene que
+        recalcularlos en cada frame. Debe volver a llamarse si cambian
+        `valor_mejora` o `radio`.
+        """
+        # Color base más intenso según el valor
+        if self.valor_mejora >= 5:
+            self._color_base = (255, 255, 0)  # Amarillo brillante para monedas de alto valor
+        elif self.valor_mejora >= 3:
+            self._color_base = (255, 215, 0)  # Dorado estándar
+        else:
+            self._color_base = (255, 200, 0)  # Dorado más tenue
+
+        radio = self.radio
+        self._orbita_brillo = radio * 0.4  # Distancia del brillo al centro
+        self._orbita_destello = radio * 0.2  # Distancia del destello al centro
+        self._escala_brillo = radio * 0.3  # Radio del brillo con intensidad máxima
+        self._escala_destello = radio * 0.15  # Radio del destello con intensidad máxima
+
+    def actualizar(self, ahora: float) -> None:
+        """
+        Actualiza el estado de la moneda en cada frame del juego.
+
+        Guarda el instante actual (del que se derivan la rotación y el tiempo
+        de vida restante) y desactiva la moneda si ya caducó.
+
+        Parameters
+        ----------
+        ahora : float
+            Tiempo de juego actual en segundos, en la misma escala que el
+            `instante` de aparición
+
+        Notes
+        -----
+        En lugar de restar `dt` a un contador en cada frame, la moneda guarda
+        su instante de caducidad y basta con una comparación.
+        """
+        if not self.activo:
+            return
+
+        self._ahora = ahora
+        if ahora >= self._t_expira:
+            self.activo = False
+
+    def pintar(self, rects: Optional[List[pygame.Rect]] = None) -> None:
+        """
+        Dibuja la moneda con efecto de rotación y brillo.
+
+        Override del método pintar de la clase base para crear un efecto visual
+        atractivo que incluye rotación y un efecto de brillo basado en el tiempo de vida.
+
+        Parameters
+        ----------
+        rects : List[pygame.Rect], optional
+            Si se indica, se le añade el rectángulo de pantalla que se dibujó
+
+        Notes
+        -----
+        La moneda se dibuja como un círculo dorado con un efecto de brillo interno
+        que cambia según el ángulo de rotación y el tiempo de vida restante.
+        El ángulo se discretiza en 256 pasos por vuelta y se lee de una tabla,
+        lo que a este tamaño no se distingue del giro continuo. Como los brillos
+        se colocan en píxeles enteros, solo hay unas decenas de aspectos
+        distintos por tipo y valor: cada uno se compone en un sprite la primera
+        vez y después basta un blit. Si la moneda queda completamente fuera de
+        la pantalla no se dibuja.
+        """
+        if not self.activo:
+            return
+
+        radio = self.radio
+        px = self.posicion.x
+        py = self.posicion.y
+        if (px + radio < 0 or px - radio > self._ancho_pantalla or
+                py + radio < 0 or py - radio > self._alto_pantalla):
+            return
+
+        # Calcular intensidad del brillo basado en el tiempo de vida
+        intensidad_brillo = self.tiempo_vida / self.tiempo_vida_maximo
+
+        # Efecto de brillo rotatorio (ángulo tomado de la tabla de giro) y
+        # destello adicional en el lado opuesto (ángulo + π)
+        coseno, seno = self._TABLA_GIRO[int(self.angulo_rotacion * self._PASOS_POR_RADIAN) & 255]
+        brillo = (int(coseno * self._orbita_brillo),
+                  int(seno * self._orbita_brillo),
+                  max(3, int(self._escala_brillo * intensidad_brillo)))
+        destello = (-int(coseno * self._orbita_destello),
+                    -int(seno * self._orbita_destello),
+                    max(1, int(self._escala_destello * intensidad_brillo)))
+
+        # Cada combinación de aspecto se compone una vez y se reutiliza
+        sprite, mitad = self._obtener_sprite(
+            ('moneda', self.tipo_mejora, self._color_base, radio, brillo, destello),
+            radio + 2, self._dibujar_moneda, brillo, destello)
+        rect = self.pantalla.blit(sprite, (int(px) - mitad, int(py) - mitad))
+        if rects is not None:
+            rects.append(rect)
+
+    def _dibujar_moneda(self, superficie: pygame.Surface, x: int, y: int, radio: int,
+                        brillo: Tuple[int, int, int], destello: Tuple[int, int, int]) -> None:
+        """
+        Dibuja la moneda con sus brillos y el símbolo de la mejora.
+
+        Parameters
+        ----------
+        superficie : pygame.Surface
+            Superficie donde se dibuja
+        x, y : int
+            Centro de la moneda en la superficie
+        radio : int
+            Radio de la moneda en píxeles
+        brillo : Tuple[int, int, int]
+            Desplazamiento (dx, dy) del brillo respecto al centro y su radio
+        destello : Tuple[int, int, int]
+            Desplazamiento (dx, dy) del destello respecto al centro y su radio
+        """
+        # Dibujar el círculo principal de la moneda (color según el valor)
+        pygame.draw.circle(superficie, self._color_base, (x, y), radio)
+        
+        # Dibujar borde de la moneda
+        pygame.draw.circle(superficie, (200, 150, 0), (x, y), radio, 2)
+
+        # Color del brillo (blanco semi-transparente)
+        color_brillo = (255, 255, 255)
+        dx, dy, radio_brillo = brillo
+        pygame.draw.circle(superficie, color_brillo, (x + dx, y + dy), radio_brillo)
+        dx, dy, radio_destello = destello
+        pygame.draw.circle(superficie, color_brillo, (x + dx, y + dy), radio_destello)
+
+        # Mostrar el símbolo de la mejora
+        texto_mejora = self._simbolo_renderizado(self.tipo_mejora)
+        texto_rect = texto_mejora.get_rect(center=(x, y))
+        superficie.blit(texto_mejora, texto_rect)
+
+    @classmethod
+    def _simbolo_renderizado(cls, tipo_mejora: str) -> pygame.Surface:
+        """
+        Devuelve el símbolo de una mejora ya renderizado.
+
+        Parameters
+        ----------
+        tipo_mejora : str
+            Tipo de mejora de la moneda
+
+        Returns
+        -------
+        pygame.Surface
+            Letra del tipo de mejora en negro ('?' si el tipo es desconocido)
+
+        Notes
+        -----
+        La fuente se abre una sola vez y cada símbolo se renderiza la primera
+        vez que se necesita; después se reutiliza en todos los frames.
+        """
+        superficie = cls._simbolos_render.get(tipo_mejora)
+        if superficie is None:
+            if cls._fuente is None:
+                cls._fuente = pygame.font.Font(None, 16)
+            simbolo = cls._SIMBOLOS_MEJORAS.get(tipo_mejora, '?')
+            superficie = cls._fuente.render(simbolo, True, (0, 0, 0))
+            cls._simbolos_render[tipo_mejora] = superficie
+        return superficie
+
+    def recolectar(self) -> Dict[str, Any]:
+        """
+        Marca la moneda como recolectada y retorna información sobre la mejora.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Diccionario con información de la mejora:
+            - 'tipo': tipo de mejora
+            - 'valor': valor de la mejora
+            - 'puntos': puntos adicionales (solo para tipo 'puntos')
+
+        Examples
+        --------
+        >>> mejora = moneda.recolectar()
+        >>> print(f"¡Mejora de {mejora['tipo']} +{mejora['valor']}!")
+        """
+        self.activo = False
+        return {
+            'tipo': self.tipo_mejora,
+            'valor': self.valor_mejora,
+            'puntos': self.valor_mejora if self.tipo_mejora == 'puntos' else 0
+        }
+
+    def obtener_tiempo_vida_restante(self) -> float:
+        """
+        Obtiene el tiempo de vida restante de la moneda.
+
+        Returns
+        -------
+        float
+            Tiempo restante en segundos antes de que la moneda desaparezca
+        """
+        return max(0.0, self.tiempo_vida)
+
+    def __repr__(self) -> str:
+        """
+        Representación oficial de la moneda para depuración.
+
+        Returns
+        -------
+        str
+            Cadena que representa el estado actual de la moneda
+        """
+        estado = "activa" if self.activo else "inactiva"
+        tiempo_restante = self.obtener_tiempo_vida_restante()
+        
+        return (f"Moneda(pos=({self.x:.1f}, {self.y:.1f}), "
+                f"tipo={self.tipo_mejora}, valor={self.valor_mejora}, "
+                f"tiempo={tiempo_restante:.1f}s, {estado})")
+
+    def __str__(self) -> str:
+        """
+        Representación legible de la moneda para usuarios.
+
+        Returns
+        -------
+        str
+            Descripción simplificada de la moneda
+        """
+        return f"Moneda de {self.tipo_mejora} (+{self.valor_mejora}) en ({int(self.x)}, {int(self.y)})"
@@ -1,3 +1,6 @@
+import math
+from typing import Iterable, Optional, Tuple
+
 import pygame
 
 from .vector2d import Vector2D
@@ -41,6 +44,8 @@ class Proyectil(Figura):
     >>> proyectil.actualizar(0.016)  # Actualizar para 16ms (60fps)
     """
 
+    _DIRECCIONES_SPRITE = 16  # Orientaciones distintas con las que se dibuja el misil
+
     def __init__(self, pantalla: pygame.Surface, x: float, y: float, 
                  direccion: 'Vector2D', velocidad: float = 300):
         """
@@ -78,10 +83,81 @@ class Proyectil(Figura):
 
         # Inicializar como figura amarilla pequeña
         super().__init__(pantalla, x, y, (255, 255, 0), 8)
+
+        # Zona en la que el proyectil sigue vivo: la pantalla más su radio
+        self._x_min = -self.radio
+        self._x_max = self._ancho_pantalla + self.radio
+        self._y_min = -self.radio
+        self._y_max = self._alto_pantalla + self.radio
         
         self.velocidad = float(velocidad)
         self.direccion = direccion.normalizar()  # Vector unitario
         self.tiempo_vida = 2.0  # segundos
+        self._precalcular_vuelo()
+
+    def _precalcular_vuelo(self) -> None:
+        """
+        Guarda las componentes de la velocidad y la orientación del sprite.
+
+        Notes
+        -----
+        La dirección y la velocidad no cambian durante el vuelo, así que el
+        movimiento de cada frame se reduce a dos multiplicaciones por `dt` y
+        la orientación del sprite (una de `_DIRECCIONES_SPRITE`) se calcula
+        una sola vez en lugar de en cada dibujo. Debe volver a llamarse si se
+        modifican `direccion` o `velocidad`.
+        """
+        direccion = self.direccion
+        self._vx = direccion.x * self.velocidad
+        self._vy = direccion.y * self.velocidad
+
+        if direccion.x == 0 and direccion.y == 0:
+            sector = None
+        else:
+            n = self._DIRECCIONES_SPRITE
+            sector = round(math.atan2(direccion.y, direccion.x) * n / math.tau) % n
+        self._sector = sector
+        self._clave_sprite = ('proyectil', self.color, self.radio, sector)
+
+    def reset(self, x: float, y: float, direccion: 'Vector2D', velocidad: float = 300) -> None:
+        """
+        Reinicializa el proyectil en el sitio para volver a dispararlo.
+
+        Parameters
+        ----------
+        x : float
+            Nueva posición horizontal del proyectil
+        y : float
+            Nueva posición vertical del proyectil
+        direccion : Vector2D
+            Vector que indica la dirección del movimiento
+        velocidad : float, optional
+            Velocidad del proyectil en píxeles por segundo (por defecto 300)
+
+        Raises
+        ------
+        TypeError
+            Si direccion no es una instancia de Vector2D
+        ValueError
+            Si la velocidad no es positiva
+
+        Notes
+        -----
+        Deja al proyectil en el mismo estado que uno recién construido.
+        """
+        # Reutilización desde el pool: solo se valida sin `python -O`
+        if __debug__:
+            if not isinstance(direccion, Vector2D):
+                raise TypeError("direccion debe ser una instancia de Vector2D")
+            if velocidad <= 0:
+                raise ValueError("La velocidad debe ser un valor positivo")
+
+        self.posicion = Vector2D(x, y)
+        self.velocidad = float(velocidad)
+        self.direccion = direccion.normalizar()
+        self.tiempo_vida = 2.0
+        self.activo = True
+        self._precalcular_vuelo()
 
     def actualizar(self, dt: float) -> None:
         """
@@ -107,16 +183,18 @@ class Proyectil(Figura):
         >>> proyectil.actualizar(0.016)  # Para 60 FPS (1/60 ≈ 0.016s)
         >>> # El proyectil se moverá: distancia = 300 * 0.016 = 4.8 píxeles
         """
-        if dt <= 0:
-            raise ValueError("dt debe ser un valor positivo")
+        # Se llama en cada frame: solo se valida sin `python -O`
+        if __debug__:
+            if dt <= 0:
+                raise ValueError("dt debe ser un valor positivo")
 
         # Solo procesar si el proyectil está activo
         if not self.activo:
             return
 
-        # 1. Movimiento del proyectil
-        movimiento = self.direccion * (self.velocidad * dt)
-        self.posicion = self.posicion + movimiento
+        # 1. Movimiento del proyectil (en el sitio, sin crear vectores)
+        self.posicion.x += self._vx * dt
+        self.posicion.y += self._vy * dt
 
         # 2. Reducir tiempo de vida
         self.tiempo_vida -= dt
@@ -124,6 +202,51 @@ class Proyectil(Figura):
         # 3. Verificar condiciones de desactivación
         self._verificar_desactivacion()
 
+    @staticmethod
+    def actualizar_muchos(proyectiles: Iterable['Proyectil'], dt: float) -> None:
+        """
+        Actualiza varios proyectiles en un solo recorrido.
+
+        Produce el mismo resultado que llamar a `actualizar` en cada uno, pero
+        con el cuerpo del bucle en un único método: se valida `dt` una vez,
+        los límites de pantalla vienen precalculados en cada proyectil y la
+        posición se mueve en el sitio sin crear ningún Vector2D.
+
+        Parameters
+        ----------
+        proyectiles : Iterable[Proyectil]
+            Proyectiles a actualizar; los inactivos se omiten
+        dt : float
+            Tiempo transcurrido desde la última actualización en segundos
+
+        Raises
+        ------
+        ValueError
+            Si dt no es un valor positivo
+        """
+        if dt <= 0:
+            raise ValueError("dt debe ser un valor positivo")
+
+        for proyectil in proyectiles:
+            if not proyectil.activo:
+                continue
+
+            # 1. Movimiento del proyectil
+            posicion = proyectil.posicion
+            x = posicion.x + proyectil._vx * dt
+            y = posicion.y + proyectil._vy * dt
+            posicion.x = x
+            posicion.y = y
+
+            # 2. Reducir tiempo de vida
+            proyectil.tiempo_vida -= dt
+
+            # 3. Desactivar si sale de pantalla o se acaba el tiempo
+            if not (proyectil._x_min <= x <= proyectil._x_max and
+                    proyectil._y_min <= y <= proyectil._y_max and
+                    proyectil.tiempo_vida > 0):
+                proyectil.activo = False
+
     def _verificar_desactivacion(self) -> None:
         """
         Verifica si el proyectil debe ser desactivado por condiciones del juego.
@@ -135,105 +258,121 @@ class Proyectil(Figura):
 
         Notes
         -----
-        Este método es llamado automáticamente por actualizar().
+        Este método es llamado automáticamente por actualizar(). Los límites
+        se calculan una vez al crear el proyectil, sin consultar la pantalla.
         """
         if not self.activo:
             return
 
-        ancho_pantalla = self.pantalla.get_width()
-        alto_pantalla = self.pantalla.get_height()
-
-        # Verificar si sale de los límites de la pantalla
-        fuera_de_pantalla = (
-            self.posicion.x < -self.radio or 
-            self.posicion.x > ancho_pantalla + self.radio or
-            self.posicion.y < -self.radio or 
-            self.posicion.y > alto_pantalla + self.radio
-        )
-
-        # Verificar tiempo de vida agotado
-        tiempo_agotado = self.tiempo_vida <= 0
-
-        # Desactivar si se cumple alguna condición
-        if fuera_de_pantalla or tiempo_agotado:
+        # Sigue vivo mientras esté en pantalla (límites precalculados) y le quede tiempo
+        posicion = self.posicion
+        if not (self._x_min <= posicion.x <= self._x_max and
+                self._y_min <= posicion.y <= self._y_max and
+                self.tiempo_vida > 0):
             self.activo = False
     
-    def pintar(self) -> None:
+    def _sprite(self) -> Tuple[pygame.Surface, int]:
         """
-        Dibuja el proyectil como un misil realista en la pantalla.
+        Obtiene el sprite del misil orientado según su dirección de movimiento.
         
-        Override del método pintar de la clase base para dibujar un misil
-        que apunta en la dirección de movimiento con detalles realistas.
+        Override del método de la clase base para dibujar un misil que apunta
+        en la dirección de movimiento con detalles realistas.
+
+        Returns
+        -------
+        Tuple[pygame.Surface, int]
+            Sprite cuadrado con el misil centrado y la mitad de su lado
+
+        Notes
+        -----
+        La dirección se redondea a una de `_DIRECCIONES_SPRITE` orientaciones
+        para que los misiles compartan unos pocos sprites pre-renderizados.
+        La orientación se calcula al disparar, en `_precalcular_vuelo`.
         """
-        if self.activo:
-            x = int(self.posicion.x)
-            y = int(self.posicion.y)
-            radio = self.radio
+        return self._obtener_sprite(self._clave_sprite, 2 * self.radio + 4,
+                                    self._dibujar_misil, self._sector)
+
+    def _dibujar_misil(self, superficie: pygame.Surface, x: int, y: int, radio: int,
+                       sector: Optional[int]) -> None:
+        """
+        Dibuja el misil con primitivas de pygame centrado en (x, y).
+
+        Parameters
+        ----------
+        superficie : pygame.Surface
+            Superficie donde se dibuja
+        x, y : int
+            Centro del misil
+        radio : int
+            Radio del proyectil
+        sector : Optional[int]
+            Orientación del misil en pasos de 1/`_DIRECCIONES_SPRITE` de vuelta;
+            None dibuja el misil simple (proyectil sin dirección)
+        """
+        # Colores para el misil
+        color_principal = self.color  # Amarillo
+        color_secundario = self._oscurecer(self.color, 50)  # Amarillo oscuro
+        color_detalle = self._oscurecer(self.color, 100)  # Naranja
+        
+        # Dirección del misil: el centro de su sector de orientación
+        if sector is not None:
+            angulo = sector * math.tau / self._DIRECCIONES_SPRITE
+            dir_normalizada = Vector2D(math.cos(angulo), math.sin(angulo))
+            
+            # Cuerpo principal del misil (elipse alargada)
+            cuerpo_longitud = radio * 2
+            cuerpo_ancho = radio
+            
+            # Calcular posición del cuerpo
+            centro_x = x - int(dir_normalizada.x * radio//2)
+            centro_y = y - int(dir_normalizada.y * radio//2)
+            
+            # Dibujar cuerpo del misil
+            pygame.draw.ellipse(superficie, color_principal,
+                              (centro_x - cuerpo_longitud//2, centro_y - cuerpo_ancho//2,
+                               cuerpo_longitud, cuerpo_ancho))
+            
+            # Punta del misil (cono)
+            punta_x = x + int(dir_normalizada.x * radio)
+            punta_y = y + int(dir_normalizada.y * radio)
+            
+            # Base del cono (perpendicular a la dirección)
+            perp_x = -dir_normalizada.y * radio // 3
+            perp_y = dir_normalizada.x * radio // 3
+            
+            base1_x = x - int(perp_x)
+            base1_y = y - int(perp_y)
+            base2_x = x + int(perp_x)
+            base2_y = y + int(perp_y)
+            
+            # Dibujar punta
+            puntos_punta = [(punta_x, punta_y), (base1_x, base1_y), (base2_x, base2_y)]
+            pygame.draw.polygon(superficie, color_secundario, puntos_punta)
+            
+            # Cola del misil (estabilizadores)
+            cola_x = x - int(dir_normalizada.x * radio)
+            cola_y = y - int(dir_normalizada.y * radio)
+            
+            # Estabilizadores laterales
+            estab_x1 = cola_x - int(perp_x * 2)
+            estab_y1 = cola_y - int(perp_y * 2)
+            estab_x2 = cola_x + int(perp_x * 2)
+            estab_y2 = cola_y + int(perp_y * 2)
             
-            # Colores para el misil
-            color_principal = self.color  # Amarillo
-            color_secundario = tuple(max(0, c - 50) for c in self.color)  # Amarillo oscuro
-            color_detalle = tuple(max(0, c - 100) for c in self.color)  # Naranja
+            pygame.draw.line(superficie, color_detalle, 
+                            (cola_x, cola_y), (estab_x1, estab_y1), 3)
+            pygame.draw.line(superficie, color_detalle, 
+                            (cola_x, cola_y), (estab_x2, estab_y2), 3)
             
-            # Calcular dirección del misil basada en la dirección de movimiento
-            if self.direccion.magnitud() > 0:
-                # Normalizar dirección para obtener ángulo
-                dir_normalizada = self.direccion.normalizar()
-                
-                # Cuerpo principal del misil (elipse alargada)
-                cuerpo_longitud = radio * 2
-                cuerpo_ancho = radio
-                
-                # Calcular posición del cuerpo
-                centro_x = x - int(dir_normalizada.x * radio//2)
-                centro_y = y - int(dir_normalizada.y * radio//2)
-                
-                # Dibujar cuerpo del misil
-                pygame.draw.ellipse(self.pantalla, color_principal,
-                                  (centro_x - cuerpo_longitud//2, centro_y - cuerpo_ancho//2,
-                                   cuerpo_longitud, cuerpo_ancho))
-                
-                # Punta del misil (cono)
-                punta_x = x + int(dir_normalizada.x * radio)
-                punta_y = y + int(dir_normalizada.y * radio)
-                
-                # Base del cono (perpendicular a la dirección)
-                perp_x = -dir_normalizada.y * radio // 3
-                perp_y = dir_normalizada.x * radio // 3
-                
-                base1_x = x - int(perp_x)
-                base1_y = y - int(perp_y)
-                base2_x = x + int(perp_x)
-                base2_y = y + int(perp_y)
-                
-                # Dibujar punta
-                puntos_punta = [(punta_x, punta_y), (base1_x, base1_y), (base2_x, base2_y)]
-                pygame.draw.polygon(self.pantalla, color_secundario, puntos_punta)
-                
-                # Cola del misil (estabilizadores)
-                cola_x = x - int(dir_normalizada.x * radio)
-                cola_y = y - int(dir_normalizada.y * radio)
-                
-                # Estabilizadores laterales
-                estab_x1 = cola_x - int(perp_x * 2)
-                estab_y1 = cola_y - int(perp_y * 2)
-                estab_x2 = cola_x + int(perp_x * 2)
-                estab_y2 = cola_y + int(perp_y * 2)
-                
-                pygame.draw.line(self.pantalla, color_detalle, 
-                                (cola_x, cola_y), (estab_x1, estab_y1), 3)
-                pygame.draw.line(self.pantalla, color_detalle, 
-                                (cola_x, cola_y), (estab_x2, estab_y2), 3)
-                
-                # Detalle central en el cuerpo
-                pygame.draw.line(self.pantalla, color_detalle,
-                                (centro_x - cuerpo_longitud//4, centro_y),
-                                (centro_x + cuerpo_longitud//4, centro_y), 2)
-            else:
-                # Fallback: misil simple si no hay dirección
-                pygame.draw.ellipse(self.pantalla, color_principal,
-                                  (x - radio, y - radio//2, radio*2, radio))
-                pygame.draw.circle(self.pantalla, color_secundario, (x + radio//2, y), radio//3)
+            # Detalle central en el cuerpo
+            pygame.draw.line(superficie, color_detalle,
+                            (centro_x - cuerpo_longitud//4, centro_y),
+                            (centro_x + cuerpo_longitud//4, centro_y), 2)
+        else:
+            # Fallback: misil simple si no hay dirección
+            pygame.draw.ellipse(superficie, color_principal,
+                              (x - radio, y - radio//2, radio*2, radio))
+            pygame.draw.circle(superficie, color_secundario, (x + radio//2, y), radio//3)
 
     def __repr__(self) -> str:
         """
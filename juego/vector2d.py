@@ -28,6 +28,9 @@ class Vector2D:
     Vector2D(6.0, 8.0)
     """
 
+    # Sin __dict__ por instancia: los vectores se crean a menudo en cada frame
+    __slots__ = ('x', 'y')
+
     def __init__(self, x: float = 0, y: float = 0):
         """
         Inicializa un vector 2D con las componentes x e y.
@@ -161,6 +164,28 @@ class Vector2D:
         """
         return math.sqrt(self.x**2 + self.y**2)
 
+    def magnitud_cuadrada(self) -> float:
+        """
+        Calcula el cuadrado de la magnitud del vector, sin raíz cuadrada.
+
+        Returns
+        -------
+        float
+            Suma de los cuadrados de las componentes
+
+        Notes
+        -----
+        Útil para comparar distancias: si a y b no son negativos,
+        a <= b equivale a a² <= b², así que no hace falta calcular la raíz.
+
+        Examples
+        --------
+        >>> v = Vector2D(3, 4)
+        >>> v.magnitud_cuadrada()
+        25.0
+        """
+        return self.x * self.x + self.y * self.y
+
     def normalizar(self) -> 'Vector2D':
         """
         Devuelve un vector unitario en la misma dirección que el vector actual.